@@ -0,0 +1,184 @@
+"""
+Read-only audit of the fleet: the current progress value of many repositories in a few requests.
+
+    python cli.py audit                     every repository of the inventory
+    python cli.py audit --manifest m.yaml   the repositories of a manifest
+    python cli.py audit Git-Progress owner/other
+
+Repositories are read by batches of 100 per GraphQL query (aliases), README text included, and
+the "Progress :" line is parsed with rewrite.read_progress, the very pattern GitEdit rewrites.
+500 repositories take 5 requests instead of 1000 REST calls. READMEs with an unusual name
+(README.rst, docs/README.md...) fall back to one REST /readme call each.
+"""
+import time
+import base64
+
+from github.GithubException import GithubException
+
+from cache import RepoCache
+from client import DEFAULT_URL, get_client
+from metrics import Tracer
+from rewrite import PROGRESS_MAP, read_progress
+from scheduler import RateScheduler
+
+# Blob expressions tried for each repository, in order
+README_NAMES = ("README.md", "readme.md", "Readme.md")
+
+# Text written after "Progress :" -> status key
+STATUS_KEYS = {value: key for key, value in PROGRESS_MAP.items()}
+
+
+def build_query(full_names: list) -> tuple:
+    """One aliased query for `full_names`: (query, variables). Names go through variables, never in the text."""
+    declarations, fields, variables = [], [], {}
+    for i, full_name in enumerate(full_names):
+        owner, name = full_name.split("/", 1)
+        variables[f"o{i}"], variables[f"n{i}"] = owner, name
+        declarations.append(f"$o{i}: String!, $n{i}: String!")
+        readmes = " ".join(
+            f'f{j}: object(expression: "HEAD:{file}") {{ ... on Blob {{ oid byteSize isBinary text }} }}'
+            for j, file in enumerate(README_NAMES)
+        )
+        fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) "
+                      f"{{ nameWithOwner isPrivate defaultBranchRef {{ name }} {readmes} }}")
+
+    query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} rateLimit {{ cost remaining resetAt }} }}"
+    return query, variables
+
+
+def status_row(full_name: str, private=None, branch: str = None, path: str = None, text: str = None,
+               error: str = None) -> dict:
+    value = read_progress(text.encode("utf-8")) if text is not None else None
+    return {
+        "repo": full_name,
+        "private": private,
+        "branch": branch,
+        "readme": path,
+        "progress": value,
+        "status": STATUS_KEYS.get(value, "unknown" if value else None),
+        "error": error,
+    }
+
+
+class Audit:
+    """
+    Reads the progress line of `full_names` (owner/repo) without writing anything.
+    Batches run one after the other: GitHub asks not to run GraphQL queries concurrently.
+    """
+    def __init__(self, token: str, full_names: list, batch: int = 100, base_url: str = DEFAULT_URL,
+                 scheduler: RateScheduler = None, cache: RepoCache = None, tracer: Tracer = None):
+        self.TOKEN = token
+        self.FullNames = list(dict.fromkeys(full_names))  # unique, in order
+        self.Batch = max(1, min(batch, 100))
+        self.GitHub = get_client(token, base_url)
+        #.. GraphQL has its own points budget, it does not share the REST scheduler
+        self.Scheduler = scheduler if scheduler is not None else RateScheduler()
+        self.Cache = cache if cache is not None else RepoCache()
+        self.Tracer = tracer if tracer is not None else Tracer()
+        self.Requests = 0
+        self.RateLimit = {}
+
+    def _query(self, chunk: list) -> dict:
+        query, variables = build_query(chunk)
+        requester = self.GitHub.requester
+
+        with self.Tracer.span("graphql_batch", f"{len(chunk)} repos") as record:
+            def post():
+                self.Requests += 1
+                record["api_calls"] += 1
+                #.. Not requester.graphql_query: a missing repository is a partial error, not a failed batch
+                return requester.requestJsonAndCheck("POST", requester.graphql_url,
+                                                     input={"query": query, "variables": variables})
+
+            _, data = self.Scheduler.call(self.GitHub, post)
+            record["bytes"] = sum(len((blob or {}).get("text") or "")
+                                  for repo in (data.get("data") or {}).values() if isinstance(repo, dict)
+                                  for key, blob in repo.items() if key.startswith("f"))
+        return data
+
+    def _fallback(self, full_name: str, private, branch: str) -> dict:
+        #.. No README under the usual names: the REST endpoint finds any README file
+        with self.Tracer.span("readme_fallback", full_name) as record:
+            self.Requests += 1
+            record["api_calls"] += 1
+            try:
+                readme = self.Scheduler.call(self.GitHub, self.Cache.readme, self.GitHub, full_name)
+            except GithubException as e:
+                if e.status == 404:
+                    return status_row(full_name, private, branch, error="no README")
+                raise
+        text = base64.b64decode(readme["content"] or "").decode("utf-8", "replace")
+        return status_row(full_name, private, branch, readme["path"], text)
+
+    def _rows(self, chunk: list, data: dict) -> list:
+        errors = {}
+        for error in data.get("errors") or []:
+            alias = (error.get("path") or [""])[0]
+            errors[alias] = error.get("message", "error")
+
+        rows = []
+        for i, full_name in enumerate(chunk):
+            repo = (data.get("data") or {}).get(f"r{i}")
+            if repo is None:
+                rows.append(status_row(full_name, error=errors.get(f"r{i}", "not found")))
+                continue
+
+            private = repo["isPrivate"]
+            branch = (repo.get("defaultBranchRef") or {}).get("name")
+            found = next(((README_NAMES[j], repo[f"f{j}"]) for j in range(len(README_NAMES))
+                          if repo.get(f"f{j}") and not repo[f"f{j}"].get("isBinary")), None)
+            if found is None:
+                rows.append(self._fallback(repo["nameWithOwner"], private, branch))
+            else:
+                rows.append(status_row(repo["nameWithOwner"], private, branch, found[0], found[1].get("text") or ""))
+        return rows
+
+    def Run(self) -> dict:
+        started = time.perf_counter()
+        rows = []
+        for start in range(0, len(self.FullNames), self.Batch):
+            chunk = self.FullNames[start:start + self.Batch]
+            data = self._query(chunk)
+            self.RateLimit = (data.get("data") or {}).get("rateLimit") or self.RateLimit
+            rows.extend(self._rows(chunk, data))
+
+        statuses = {}
+        for row in rows:
+            if row["status"]:
+                statuses[row["status"]] = statuses.get(row["status"], 0) + 1
+
+        return {
+            "results": rows,
+            "totals": {
+                "repos": len(rows),
+                "with_marker": sum(1 for row in rows if row["progress"] is not None),
+                "without_marker": sum(1 for row in rows if row["progress"] is None and not row["error"]),
+                "errors": sum(1 for row in rows if row["error"]),
+                "statuses": statuses,
+                "requests": self.Requests,
+                "wall_seconds": round(time.perf_counter() - started, 3),
+            },
+            "rate_limit": self.RateLimit,
+        }
+
+
+def print_table(report: dict):
+    rows = report["results"]
+    width = max([len(row["repo"]) for row in rows] + [10])
+    print(f"{'REPOSITORY':<{width}}  {'VIS':<4} {'STATUS':<13} PROGRESS")
+    for row in rows:
+        visibility = "" if row["private"] is None else "🔒" if row["private"] else "🌐"
+        if row["error"]:
+            progress = f"❌ {row['error']}"
+        else:
+            progress = row["progress"] or "— no progress line"
+        print(f"{row['repo']:<{width}}  {visibility:<4} {row['status'] or '':<13} {progress}")
+
+    totals = report["totals"]
+    print(
+        f"\n💠 {totals['repos']} repositories: {totals['with_marker']} with a progress line, "
+        f"{totals['without_marker']} without, {totals['errors']} unreadable "
+        f"({totals['requests']} requests, {totals['wall_seconds']}s)"
+    )
+    if totals["statuses"]:
+        print("💠 " + ", ".join(f"{key} {count}" for key, count in sorted(totals["statuses"].items())))
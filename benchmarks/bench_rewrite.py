@@ -0,0 +1,87 @@
+"""
+Micro-benchmark of the README progress-line rewrite.
+
+Compares the engine in rewrite.py with the previous GitEdit transform
+(regex compiled per call, search + sub over the whole text, utf-8 decode / encode):
+    - a few multi-megabyte READMEs (marker at the top, in the middle, missing)
+    - thousands of small READMEs
+
+Usage: python benchmarks/bench_rewrite.py [--repeat N]
+"""
+import os
+import re
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rewrite import rewrite_progress  # noqa: E402
+
+VALUE = "🟢 Ended"
+
+
+def legacy_rewrite(content: bytes, progress_value: str) -> bytes:
+    #.. GitEdit before the rewrite engine, kept here as the baseline
+    content_decoded = content.decode("utf-8")
+    pattern = re.compile(r'^([ >\<\-\*\`]*progress\s*:\s*)(.*?)([ >\<\-\*\`]*)$', re.IGNORECASE | re.MULTILINE)
+
+    def replace_progression(match):
+        return f"{match.group(1)}{progress_value}{match.group(3)}\n"
+
+    if re.search(pattern, content_decoded):
+        updated_content = re.sub(pattern, replace_progression, content_decoded)
+    else:
+        updated_content = content_decoded + f"\n\nProgress : {progress_value}"
+    return updated_content.encode("utf-8")
+
+
+def make_readme(size: int, marker: str, newline: str = "\n") -> bytes:
+    line = "Lorem ipsum dolor sit amet, **consectetur** adipiscing elit — ✨ sed do eiusmod." + newline
+    body = line * max(1, size // len(line.encode("utf-8")))
+    half = len(body) // 2
+    progress = f"> Progress : 🔴 Under Development{newline}"
+
+    if marker == "top":
+        text = "# Project" + newline + progress + body
+    elif marker == "middle":
+        text = body[:half] + newline + progress + body[half:]
+    else:
+        text = body
+    return text.encode("utf-8")
+
+
+def run(label: str, func, docs: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for doc in docs:
+            func(doc, VALUE)
+        best = min(best, time.perf_counter() - started)
+
+    total = sum(len(doc) for doc in docs)
+    print(f"  {label:<10} {best * 1000:>10.2f} ms   {total / best / 1e6:>9.1f} MB/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the README progress-line rewrite.")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the best one is kept")
+    args = parser.parse_args()
+
+    cases = [
+        ("4 MB, marker at the top", [make_readme(4_000_000, "top")]),
+        ("4 MB, marker in the middle", [make_readme(4_000_000, "middle")]),
+        ("4 MB, no marker", [make_readme(4_000_000, "none")]),
+        ("4 MB, CRLF, marker at the top", [make_readme(4_000_000, "top", "\r\n")]),
+        ("5000 x 2 KB READMEs", [make_readme(2_000, "top") for _ in range(5000)]),
+    ]
+
+    for title, docs in cases:
+        print(f"\n💠 {title}")
+        legacy = run("legacy", legacy_rewrite, docs, args.repeat)
+        engine = run("engine", lambda doc, value: rewrite_progress(doc, value)[0], docs, args.repeat)
+        print(f"  speedup    {legacy / engine:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
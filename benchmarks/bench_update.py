@@ -0,0 +1,160 @@
+"""
+Offline benchmark of the update path against benchmarks/fake_github.py.
+
+Scenarios:
+    single         Master.GitEdit one repository after the other (latency percentiles)
+    batch          Fleet over every repository (repos/second)
+    batch rerun    same manifest again, repositories already up to date (index skip)
+    inventory      Fleet over new repositories checked from a RepoInventory (no get_repo)
+    audit          audit.Audit reading the progress line of the same repositories (GraphQL batches)
+
+Every scenario reports the requests made per update, so a regression that adds a round trip
+shows up even with zero latency. Nothing leaves the machine and no user file is touched.
+
+Scenarios run with the RateScheduler Fleet / watch / service ship with (10 req/s, 0.75 s between
+writes), so wall clock and repos/s are what a real run gets; the write pacing floor is printed
+next to them. --unpaced lifts both limits to time the code path alone.
+
+Usage: python benchmarks/bench_update.py [--repos 40] [--workers 16] [--latency 0.05] [--error-rate 0.0]
+                                         [--max-requests 3] [--unpaced]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_github import FakeGitHub  # noqa: E402
+from github_edit import Master  # noqa: E402
+from fleet import Fleet  # noqa: E402
+from cache import RepoCache, StatusIndex, RepoInventory  # noqa: E402
+from client import get_client  # noqa: E402
+from scheduler import RateScheduler  # noqa: E402
+from audit import Audit  # noqa: E402
+
+
+def percentiles(samples: list) -> str:
+    samples = sorted(samples)
+    if not samples:
+        return "n/a"
+
+    def at(q: float) -> float:
+        return samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+
+    return f"p50 {at(0.50):7.1f} ms   p95 {at(0.95):7.1f} ms   p99 {at(0.99):7.1f} ms   max {samples[-1] * 1000:7.1f} ms"
+
+
+def report(title: str, fake: FakeGitHub, updates: int, wall: float, latencies: list, failed: int,
+           write_interval: float = 0.0) -> float:
+    stats = fake.stats()
+    per_update = stats["requests"] / updates if updates else 0.0
+    print(f"\n💠 {title}")
+    print(f"  updates          {updates}  ({failed} failed)")
+    print(f"  wall clock       {wall:.2f} s   ->  {updates / wall if wall else 0:.1f} repos/s")
+    if write_interval:
+        writes = stats.get("PUT contents", 0)
+        floor = max(writes - 1, 0) * write_interval  # the first write does not wait
+        print(f"  pacing floor     {floor:.2f} s   ({writes} writes, {write_interval} s apart)")
+    print(f"  latency          {percentiles(latencies)}")
+    print(f"  requests/update  {per_update:.2f}   "
+          f"(GET repo {stats.get('GET repo', 0)}, GET readme {stats.get('GET readme', 0)}, "
+          f"PUT {stats.get('PUT contents', 0)}, 409 {stats.get('status_409', 0)}, list {stats.get('GET user/repos', 0)}, graphql {stats.get('POST graphql', 0)}, 304 {stats.get('status_304', 0)}, 5xx {stats.get('status_502', 0)})")
+    print(f"  connections      {stats.get('connections', 0)}")
+    return per_update
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Master / Fleet against a local fake GitHub API.")
+    parser.add_argument("--repos", type=int, default=40)
+    parser.add_argument("--single", type=int, default=10, help="repositories for the sequential scenario")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request on the fake API")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 502")
+    parser.add_argument("--conflict-rate", type=float, default=0.0,
+                        help="fraction of README writes beaten by another writer (409, retried by Master)")
+    parser.add_argument("--unpaced", action="store_true",
+                        help="lift the RateScheduler rate and write pacing: times the code path only, "
+                             "real runs cannot reach these figures")
+    parser.add_argument("--max-requests", type=float, default=0.0,
+                        help="exit with 1 when a scenario needs more requests per update (regression gate)")
+    args = parser.parse_args()
+
+    fake = FakeGitHub(latency=args.latency, error_rate=args.error_rate, conflict_rate=args.conflict_rate)
+    url = fake.start()
+    workdir = tempfile.mkdtemp(prefix="git-progress-bench-")
+
+    def scheduler() -> RateScheduler:
+        if args.unpaced:
+            return RateScheduler(max_rate=10_000, burst=10_000, write_interval=0.0, backoff=0.05)
+        return RateScheduler()
+
+    interval = scheduler().WriteInterval
+    print(f"💠 Scheduler: {'unpaced (code path only)' if args.unpaced else 'shipped defaults'}, "
+          f"{scheduler().MaxRate:g} req/s, {interval} s between writes")
+
+    worst = 0.0
+    try:
+        #.. Single updates, one after the other
+        cache = RepoCache(os.path.join(workdir, "single-cache.json"))
+        index = StatusIndex(os.path.join(workdir, "single-status.json"))
+        shared = scheduler()
+        latencies, failed = [], 0
+        started = time.perf_counter()
+        for i in range(args.single):
+            t = time.perf_counter()
+            Call = Master(("bench", "token", f"single-{i}", "finished", "public"), cache=cache,
+                          scheduler=shared, index=index, base_url=url)
+            failed += not Call.GitEdit()
+            latencies.append(time.perf_counter() - t)
+        worst = report("single (sequential GitEdit)", fake, args.single, time.perf_counter() - started, latencies, failed,
+                   interval)
+
+        #.. Batch, then the same batch again
+        entries = [(f"repo-{i}", "finished", "public") for i in range(args.repos)]
+        cache = RepoCache(os.path.join(workdir, "batch-cache.json"))
+        index = StatusIndex(os.path.join(workdir, "batch-status.json"))
+
+        for title in (f"batch ({args.workers} workers)", "batch rerun (already applied)"):
+            fake.reset_stats()
+            result = Fleet("bench", "token", entries, args.workers, cache=cache, scheduler=scheduler(),
+                           index=index, base_url=url).Run()
+            totals = result["totals"]
+            worst = max(worst, report(title, fake, totals["repos"], totals["wall_seconds"],
+                                      [r["seconds"] for r in result["results"]], totals["failed"], interval))
+
+        #.. Inventory: one paginated listing replaces one get_repo per repository
+        entries = [(f"inv-{i}", "finished", "public") for i in range(args.repos)]
+        for name, _, _ in entries:
+            fake.repo(f"bench/{name}")
+        fake.reset_stats()
+        started = time.perf_counter()
+        inventory = RepoInventory(os.path.join(workdir, "inventory.json"))
+        inventory.refresh(get_client("token", url))
+        result = Fleet("bench", "token", entries, args.workers, cache=RepoCache(os.path.join(workdir, "inv-cache.json")),
+                       scheduler=scheduler(), index=StatusIndex(os.path.join(workdir, "inv-status.json")),
+                       base_url=url, inventory=inventory).Run()
+        totals = result["totals"]
+        worst = max(worst, report("inventory (listing + batch)", fake, totals["repos"], time.perf_counter() - started,
+                                  [r["seconds"] for r in result["results"]], totals["failed"], interval))
+
+        #.. Audit: the same repositories read back, 100 per GraphQL query
+        fake.reset_stats()
+        result = Audit("token", [f"bench/{name}" for name, _, _ in entries], base_url=url, scheduler=scheduler(),
+                       cache=RepoCache(os.path.join(workdir, "audit-cache.json"))).Run()
+        totals = result["totals"]
+        worst = max(worst, report("audit (GraphQL, read-only)", fake, totals["repos"], totals["wall_seconds"],
+                                  [], totals["errors"]))
+    finally:
+        fake.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.max_requests and worst > args.max_requests:
+        print(f"\n❌ {worst:.2f} requests per update, the limit is {args.max_requests}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
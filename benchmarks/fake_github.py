@@ -0,0 +1,305 @@
+"""
+Local stand-in for the GitHub REST endpoints used by Master.GitCheck / GitEdit:
+    GET  /repos/{owner}/{repo}                    (get_repo, ETag / 304 aware)
+    GET  /repos/{owner}/{repo}/readme             (get_readme, ETag / 304 aware)
+    PUT  /repos/{owner}/{repo}/contents/{path}    (update_file, sha checked -> 409)
+    GET  /user/repos                              (RepoInventory, paginated, ETag / 304 aware)
+    POST /graphql                                 (audit.py aliased batches, README.md blobs)
+    POST /app/installations/{id}/access_tokens    (credentials.AppCredential, Bearer JWT only)
+    GET  /rate_limit
+
+Latency, error rate and the primary rate limit are configurable, and every request is
+counted, so the update path can be measured offline without committing anything.
+"""
+import re
+import json
+import time
+import base64
+import random
+import socket
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+DEFAULT_README = "# Project\n\n> Progress : 🔴 Under Development\n\nSome text.\n"
+
+
+class FakeGitHub:
+    """
+    In-memory GitHub API served on 127.0.0.1.
+        latency     seconds added to every answer (+/- `jitter` fraction)
+        error_rate  fraction of requests answered with a 502
+        rate_limit  primary budget per hour and per Authorization header, 304 answers do not consume it
+        conflict_rate  fraction of README writes beaten by another writer (the PUT gets a 409)
+    Repositories are created on first access; `private` lists the private ones, `missing` the ones
+    that do not exist (GraphQL only).
+    """
+    def __init__(self, latency: float = 0.0, jitter: float = 0.2, error_rate: float = 0.0,
+                 rate_limit: int = 5000, private: tuple = (), readme: str = DEFAULT_README,
+                 conflict_rate: float = 0.0, missing: tuple = ()):
+        self.Latency = latency
+        self.Jitter = jitter
+        self.ErrorRate = error_rate
+        self.RateLimit = rate_limit
+        self.ConflictRate = conflict_rate
+        self.Private = set(private)
+        self.Missing = set(missing)
+        self.Readme = readme
+
+        self._lock = threading.Lock()
+        self._repos = {}  # full_name -> {"private": bool, "path": str, "content": bytes}
+        self._budgets = {}  # Authorization header -> remaining requests
+        self._reset = int(time.time()) + 3600
+        self._counts = {}
+        self._server = None
+
+    #.. Server lifecycle
+    def start(self) -> str:
+        handler = type("Handler", (_Handler,), {"fake": self})
+        self._server = _Server(("127.0.0.1", 0), handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    #.. State helpers
+    def repo(self, full_name: str) -> dict:
+        with self._lock:
+            if full_name not in self._repos:
+                self._repos[full_name] = {
+                    "private": full_name in self.Private,
+                    "path": "README.md",
+                    "content": self.Readme.encode("utf-8"),
+                    "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                }
+            return self._repos[full_name]
+
+    def readme(self, full_name: str) -> str:
+        return self.repo(full_name)["content"].decode("utf-8")
+
+    def count(self, key: str):
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        counts["requests"] = sum(v for k, v in counts.items() if k.startswith(("GET", "PUT", "POST")))
+        counts["rate_remaining"] = sum(self._budgets.values()) if self._budgets else self.RateLimit
+        return counts
+
+    def reset_stats(self):
+        with self._lock:
+            self._counts = {}
+
+    def remaining(self, key: str = "") -> int:
+        with self._lock:
+            return self._budgets.get(key, self.RateLimit)
+
+    def budgets(self) -> dict:
+        """Remaining budget of every credential seen so far."""
+        with self._lock:
+            return dict(self._budgets)
+
+    def spend(self, cached: bool, key: str = "") -> tuple:
+        """Consumes one request of `key`'s budget (not for 304) and returns the rate limit headers."""
+        with self._lock:
+            if time.time() >= self._reset:
+                self._budgets, self._reset = {}, int(time.time()) + 3600
+            remaining = self._budgets.get(key, self.RateLimit)
+            if not cached:
+                remaining = max(0, remaining - 1)
+            self._budgets[key] = remaining
+            return remaining, self._reset
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # many workers connect at once, the default backlog (5) adds 1 s SYN retries
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fake: FakeGitHub = None
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        #.. Headers and body are two writes: without this, keep-alive answers wait for delayed ACKs
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.fake.count("connections")  # one per TCP connection, keep-alive requests share it
+
+    def _send(self, code: int, body=None, headers: dict = None, cached: bool = False):
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        remaining, reset = self.fake.spend(cached, self.headers.get("Authorization", ""))
+        self.fake.count(f"status_{code}")
+
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("X-RateLimit-Limit", str(self.fake.RateLimit))
+        self.send_header("X-RateLimit-Remaining", str(remaining))
+        self.send_header("X-RateLimit-Reset", str(reset))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _prelude(self, verb: str, kind: str) -> bool:
+        """Latency, error injection and rate limit; False when the request was already answered."""
+        self.fake.count(f"{verb} {kind}")
+        if self.fake.Latency:
+            time.sleep(max(0.0, random.gauss(self.fake.Latency, self.fake.Latency * self.fake.Jitter)))
+
+        if self.fake.ErrorRate and random.random() < self.fake.ErrorRate:
+            self._send(502, {"message": "Server Error (injected)"})
+            return False
+
+        if self.fake.remaining(self.headers.get("Authorization", "")) <= 0:
+            self._send(403, {"message": "API rate limit exceeded (fake)"})
+            return False
+        return True
+
+    def _base(self) -> str:
+        return f"http://{self.headers['Host']}"
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+
+        if path == "/user/repos":
+            return self._list_repos()
+
+        if path == "/rate_limit":
+            remaining, reset = self.fake.remaining(self.headers.get("Authorization", "")), self.fake._reset
+            core = {"limit": self.fake.RateLimit, "remaining": remaining, "reset": reset, "used": 0}
+            return self._send(200, {"resources": {"core": core}, "rate": core}, cached=True)
+
+        match = re.match(r"^/repos/([^/]+)/([^/]+)(/readme)?$", path)
+        if not match:
+            self.fake.count("GET other")
+            return self._send(404, {"message": "Not Found"})
+
+        full_name = f"{match[1]}/{match[2]}"
+        if not self._prelude("GET", "readme" if match[3] else "repo"):
+            return
+        repo = self.fake.repo(full_name)
+
+        if match[3]:
+            sha = hashlib.sha1(repo["content"]).hexdigest()
+            etag = f'"{sha}"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, None, {"ETag": etag}, cached=True)
+            body = {
+                "type": "file", "encoding": "base64", "name": repo["path"], "path": repo["path"], "sha": sha,
+                "size": len(repo["content"]), "content": base64.b64encode(repo["content"]).decode("ascii"),
+                "url": f"{self._base()}/repos/{full_name}/contents/{repo['path']}",
+            }
+            return self._send(200, body, {"ETag": etag})
+
+        etag = f'"repo-{full_name}-{repo["private"]}"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, None, {"ETag": etag}, cached=True)
+        body = {
+            "full_name": full_name, "name": match[2], "owner": {"login": match[1]},
+            "private": repo["private"], "default_branch": "main", "url": f"{self._base()}/repos/{full_name}",
+        }
+        return self._send(200, body, {"ETag": etag})
+
+    def _list_repos(self):
+        if not self._prelude("GET", "user/repos"):
+            return
+        query = dict(part.split("=", 1) for part in self.path.partition("?")[2].split("&") if "=" in part)
+        per_page, page = int(query.get("per_page", 30)), int(query.get("page", 1))
+        with self.fake._lock:
+            repos = sorted(self.fake._repos.items(), key=lambda item: item[1]["updated_at"], reverse=True)
+        body = [
+            {"full_name": name, "name": name.split("/")[1], "private": repo["private"], "default_branch": "main",
+             "updated_at": repo["updated_at"]}
+            for name, repo in repos[(page - 1) * per_page:page * per_page]
+        ]
+        etag = f'"{hashlib.sha1(json.dumps(body).encode()).hexdigest()}"'
+        headers = {"ETag": etag}
+        if page * per_page < len(repos):
+            headers["Link"] = (f'<{self._base()}/user/repos?per_page={per_page}&sort=updated&direction=desc'
+                               f'&page={page + 1}>; rel="next"')
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, None, headers, cached=True)
+        return self._send(200, body, headers)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        match = re.match(r"^/app/installations/(\d+)/access_tokens$", self.path.split("?")[0])
+        if match:
+            return self._mint(match.group(1))
+        if self.path.split("?")[0] != "/graphql":
+            self.fake.count("POST other")
+            return self._send(404, {"message": "Not Found"})
+        if not self._prelude("POST", "graphql"):
+            return
+
+        variables, data, errors = payload.get("variables") or {}, {}, []
+        for alias, owner, name in re.findall(r"(r\d+): repository\(owner: \$(\w+), name: \$(\w+)\)", payload["query"]):
+            full_name = f"{variables[owner]}/{variables[name]}"
+            if full_name in self.fake.Missing:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias],
+                               "message": f"Could not resolve to a Repository with the name '{full_name}'."})
+                continue
+            repo = self.fake.repo(full_name)
+            blob = {"oid": hashlib.sha1(repo["content"]).hexdigest(), "byteSize": len(repo["content"]),
+                    "isBinary": False, "text": repo["content"].decode("utf-8")}
+            data[alias] = {"nameWithOwner": full_name, "isPrivate": repo["private"],
+                           "defaultBranchRef": {"name": "main"},
+                           "f0": blob if repo["path"] == "README.md" else None, "f1": None, "f2": None}
+        data["rateLimit"] = {"cost": 1, "remaining": 4999, "resetAt": "2099-01-01T00:00:00Z"}
+        return self._send(200, {"data": data, **({"errors": errors} if errors else {})})
+
+    def _mint(self, installation: str):
+        if not self._prelude("POST", "access_tokens"):
+            return
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self._send(401, {"message": "A JSON web token could not be decoded"})
+        expires = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 3600))
+        return self._send(201, {"token": f"ghs_{installation}_{random.getrandbits(32):08x}", "expires_at": expires})
+
+    def do_PUT(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        match = re.match(r"^/repos/([^/]+)/([^/]+)/contents/(.+)$", self.path)
+        if not match:
+            self.fake.count("PUT other")
+            return self._send(404, {"message": "Not Found"})
+        if not self._prelude("PUT", "contents"):
+            return
+
+        repo = self.fake.repo(f"{match[1]}/{match[2]}")
+        with self.fake._lock:
+            if self.fake.ConflictRate and random.random() < self.fake.ConflictRate:
+                #.. A bot commits to the README just before us
+                repo["content"] += f"\n<!-- other writer {random.random():.6f} -->\n".encode()
+            current = hashlib.sha1(repo["content"]).hexdigest()
+            if payload.get("sha") != current:
+                conflict = True
+            else:
+                conflict = False
+                repo["content"] = base64.b64decode(payload["content"])
+                repo["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                new_sha = hashlib.sha1(repo["content"]).hexdigest()
+
+        if conflict:
+            return self._send(409, {"message": f"{match[3]} does not match {payload.get('sha')}"})
+
+        body = {
+            "content": {"type": "file", "name": match[3], "path": match[3], "sha": new_sha},
+            "commit": {"sha": hashlib.sha1(f"commit-{new_sha}".encode()).hexdigest(), "message": payload["message"]},
+        }
+        return self._send(200, body)
@@ -1,4 +1,5 @@
-from PyQt6.QtWidgets import QMessageBox, QWidget
+from PyQt6.QtWidgets import QMessageBox, QWidget, QTextEdit
+from PyQt6.QtCore import QObject, pyqtSignal
 
 def show_box(code: int, data: str = None, parent: QWidget = None):
     """
@@ -8,7 +9,7 @@ def show_box(code: int, data: str = None, parent: QWidget = None):
         data (str, optional): Additional information or error details to include in the message. Defaults to None.
         parent (QWidget, optional): The parent widget for the message box. Defaults to None.
     Behavior:
-        - For specific codes (e.g., 404, 403, 505, 101, 20), displays a tailored message and icon.
+        - For specific codes (e.g., 404, 403, 505, 101, 409, 499, 207, 20), displays a tailored message and icon.
         - If `data` is provided, it is included in the message for certain codes.
         - Shows the message box modally with an OK button.
     Returns:
@@ -45,6 +46,21 @@ def show_box(code: int, data: str = None, parent: QWidget = None):
             msg = f"🛑 An internal error occurred:\n\n{data}"
             icon = QMessageBox.Icon.Critical
         
+        elif code == 409:
+            title += "Write Conflict"
+            msg = f"⚔️ The file changed while it was being updated:\n\n{data}"
+            icon = QMessageBox.Icon.Warning
+
+        elif code == 499:
+            title += "Update Cancelled"
+            msg = f"🛑 The update was cancelled :\n\n{data}"
+            icon = QMessageBox.Icon.Information
+
+        elif code == 207:
+            title += "Update Summary"
+            msg = f"⚠️ Some updates failed :\n\n{data}"
+            icon = QMessageBox.Icon.Warning
+
         elif code == 20 :
             title += "Information"
             msg = f"✔️ Successful Operation : \n\n{data}"
@@ -61,3 +77,37 @@ def show_box(code: int, data: str = None, parent: QWidget = None):
     box.setText(msg)
     box.setStandardButtons(QMessageBox.StandardButton.Ok)
     box.exec()
+
+
+class PanelReporter(QObject):
+    """
+    Non-blocking reporter (see reporters.py) writing to a log panel.
+    Create it on the GUI thread: messages emitted by worker threads are queued to the panel.
+    """
+    message = pyqtSignal(str)
+
+    def __init__(self, panel: QTextEdit):
+        super().__init__()
+        self.message.connect(panel.append)
+
+    def report(self, code: int, message: str, repo: str = ""):
+        self.message.emit(f"[{repo}] {message.strip()}\n")
+
+    def progress(self, text: str, repo: str = ""):
+        self.message.emit(f"[{repo}] {text}")
+
+
+def show_summary(results: list, parent: QWidget = None):
+    """
+    The only modal of an update run, shown once every queued update is over.
+    Parameters:
+        results (list): (repo, ok, code, message) per update.
+    """
+    if len(results) == 1:
+        _, _, code, message = results[0]
+        show_box(code, message, parent)
+        return
+
+    failed = sum(1 for result in results if not result[1])
+    lines = "\n".join(f"{'✅' if result[1] else '❌'} {result[0]}" for result in results)
+    show_box(20 if not failed else 207, f"{len(results) - failed} updated, {failed} failed\n\n{lines}", parent)
@@ -0,0 +1,241 @@
+import os
+import json
+import hashlib
+import threading
+
+# Same folder NeonApp uses for config.ini
+CONFIG_DIR = os.path.join(os.getenv("APPDATA") or os.path.expanduser("~"), "GitHubProgression")
+
+
+class JsonStore:
+    """Small JSON file kept in CONFIG_DIR, loaded once and written back atomically by save()."""
+    def __init__(self, path: str):
+        self.Path = path
+        self._lock = threading.Lock()
+        #.. Held from snapshot to os.replace: an older snapshot never overwrites a newer one
+        self._save_lock = threading.Lock()
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict:
+        try:
+            with open(self.Path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        with self._save_lock:
+            with self._lock:  #.. Updates only wait for the snapshot, not for the disk
+                if not self._dirty:
+                    return
+                data = json.dumps(self._entries)
+                self._dirty = False
+
+            try:
+                os.makedirs(os.path.dirname(self.Path), exist_ok=True)
+                tmp = f"{self.Path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp, self.Path)
+            except OSError:
+                with self._lock:
+                    self._dirty = True  # written by the next save
+                raise
+
+    def forget(self, key: str):
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+
+class RepoCache(JsonStore):
+    """
+    Repository / README metadata cache shared by Master instances.
+        - Only metadata is kept, never a Repository: those are bound to the client (token) that
+          built them, and a cache shared by several credentials would write with the wrong one.
+        - Repo and README metadata are stored on disk with their ETag, so the next run
+          revalidates them with `If-None-Match` (a 304 is cheap and not rate limited).
+    """
+    def __init__(self, path: str = None):
+        super().__init__(path or os.path.join(CONFIG_DIR, "cache.json"))  # url -> {"etag": ..., "data": {...}}
+
+    def fetch(self, GitHub, url: str, fields: tuple) -> dict:
+        """
+        Conditional GET of `url`, keeping only `fields` of the JSON answer.
+        Returns the cached copy when GitHub answers 304 Not Modified.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+
+        headers = {"If-None-Match": entry["etag"]} if entry else {}
+        response_headers, data = GitHub.requester.requestJsonAndCheck("GET", url, headers=headers)
+
+        if data is None and entry:  # 304 Not Modified
+            return entry["data"]
+
+        kept = {key: data.get(key) for key in fields}
+        etag = response_headers.get("etag")
+        if etag:
+            with self._lock:
+                self._entries[url] = {"etag": etag, "data": kept}
+                self._dirty = True
+        return kept
+
+    def repo(self, GitHub, full_name: str) -> dict:
+        """Repository metadata (full_name, private, default_branch), revalidated by ETag on every call."""
+        return self.fetch(GitHub, f"/repos/{full_name}", ("full_name", "private", "default_branch"))
+
+    def readme(self, GitHub, full_name: str) -> dict:
+        """Returns the README metadata (path, sha, base64 content), revalidated by ETag."""
+        return self.fetch(GitHub, self.readme_url(full_name), ("path", "sha", "content", "encoding"))
+
+    @staticmethod
+    def readme_url(full_name: str) -> str:
+        return f"/repos/{full_name}/readme"
+
+
+class StatusIndex(JsonStore):
+    """
+    Last status applied to each repository, with the README blob SHA it produced.
+    A repository whose recorded status, visibility and mode match the request can be skipped
+    without any network call. The mode is "readme" (GitEdit) or "tree" (GitEditTree, every
+    marked file): a tree update also covers the README, a README update does not cover docs/.
+    """
+    def __init__(self, path: str = None):
+        super().__init__(path or os.path.join(CONFIG_DIR, "status.json"))  # full_name -> {...}
+
+    def get(self, full_name: str) -> dict:
+        with self._lock:
+            return self._entries.get(full_name)
+
+    def is_current(self, full_name: str, progress_value: str, visibility: str, mode: str = "readme") -> bool:
+        entry = self.get(full_name)
+        if not entry or entry["status"] != progress_value or entry["visibility"] != visibility:
+            return False
+        return mode == "readme" or entry.get("mode", "readme") == mode
+
+    def record(self, full_name: str, progress_value: str, visibility: str, sha: str, mode: str = "readme"):
+        with self._lock:
+            self._entries[full_name] = {"status": progress_value, "visibility": visibility, "sha": sha, "mode": mode}
+            self._dirty = True
+
+class RepoInventory(JsonStore):
+    """
+    Local inventory of the repositories a token can see: name, visibility, default branch,
+    README path and SHA. Filled from the paginated /user/repos listing and refreshed incrementally:
+        - every page is revalidated with its ETag, a 304 on the first page means nothing changed;
+        - pages are sorted by update time, the walk stops at the first repository already known
+          with the same update time;
+        - `full=True` walks every page and drops the repositories that are gone.
+    Master answers existence / visibility checks from it, NeonApp completes repo names with it.
+    """
+    LIST_URL = "/user/repos?per_page=100&sort=updated&direction=desc"
+
+    def __init__(self, path: str = None):
+        super().__init__(path or os.path.join(CONFIG_DIR, "inventory.json"))
+        self._entries.setdefault("repos", {})  # full_name -> {...}
+        self._entries.setdefault("lists", {})  # token key -> {"etags": {url: etag}}
+
+    @staticmethod
+    def _list_key(GitHub) -> str:
+        #.. Listings of several tokens live side by side, the token itself is never written
+        auth = {}
+        if GitHub.requester.auth is not None:
+            GitHub.requester.auth.authentication(auth)
+        return hashlib.sha256(auth.get("Authorization", "").encode()).hexdigest()[:16]
+
+    def refresh(self, GitHub, full: bool = False) -> int:
+        """Pulls the listing (see class docstring), returns the number of repositories added or changed."""
+        key = self._list_key(GitHub)
+        with self._lock:
+            known = dict(self._entries["repos"])
+            etags = dict(self._entries["lists"].get(key, {}).get("etags", {}))
+
+        url, first, seen, fresh, new_etags = self.LIST_URL, True, set(), {}, {}
+        while url:
+            headers = {"If-None-Match": etags[url]} if url in etags and not full else {}
+            response_headers, data = GitHub.requester.requestJsonAndCheck("GET", url, headers=headers)
+            if data is None:  # 304: this page did not move, the older ones neither
+                if first:
+                    new_etags = etags
+                break
+            first = False
+            if response_headers.get("etag"):
+                new_etags[url] = response_headers["etag"]
+
+            reached_known = False
+            for item in data:
+                full_name = item["full_name"]
+                seen.add(full_name)
+                old = known.get(full_name, {})
+                entry = {
+                    "full_name": full_name,
+                    "private": item.get("private", False),
+                    "default_branch": item.get("default_branch") or "main",
+                    "updated_at": item.get("updated_at") or "",
+                    "readme_path": old.get("readme_path"),
+                    "sha": old.get("sha"),
+                    "list": key,
+                }
+                if old and old.get("updated_at") == entry["updated_at"] and not full:
+                    reached_known = True
+                if entry != old:
+                    fresh[full_name] = entry
+
+            url = _next_link(response_headers.get("link", ""))
+            if reached_known:
+                new_etags = {**etags, **new_etags}
+                break
+
+        with self._lock:
+            repos = self._entries["repos"]
+            if full and not url:
+                for full_name in [n for n, e in repos.items() if e.get("list") == key and n not in seen]:
+                    del repos[full_name]
+            repos.update(fresh)
+            self._entries["lists"][key] = {"etags": new_etags}
+            self._dirty = True
+        return len(fresh)
+
+    def get(self, full_name: str) -> dict:
+        """Metadata shaped like RepoCache.repo (full_name, private, default_branch), or None."""
+        with self._lock:
+            repos = self._entries["repos"]
+            entry = repos.get(full_name)
+            if entry is None:
+                #.. GitHub names are case-insensitive: "fonixardent/git-progress" is FonixArdent/Git-Progress
+                key = full_name.lower()
+                entry = next((e for name, e in repos.items() if name.lower() == key), None)
+        if entry is None:
+            return None
+        return {"full_name": entry["full_name"], "private": entry["private"], "default_branch": entry["default_branch"]}
+
+    def note(self, meta: dict):
+        """Adds / corrects a repository from a live answer (RepoCache.repo metadata)."""
+        with self._lock:
+            entry = self._entries["repos"].setdefault(meta["full_name"], {"full_name": meta["full_name"]})
+            entry.update(private=meta["private"], default_branch=meta.get("default_branch") or "main")
+            self._dirty = True
+
+    def note_readme(self, full_name: str, path: str, sha: str):
+        with self._lock:
+            entry = self._entries["repos"].get(full_name)
+            if entry is not None and (entry.get("readme_path"), entry.get("sha")) != (path, sha):
+                entry.update(readme_path=path, sha=sha)
+                self._dirty = True
+
+    def names(self, owner: str = "") -> list:
+        """Completion list: bare names of `owner`'s repositories first, then owner/name for the others."""
+        with self._lock:
+            full_names = sorted(self._entries["repos"], key=str.lower)
+        own = [n.split("/", 1)[1] for n in full_names if owner and n.lower().startswith(owner.lower() + "/")]
+        return own + [n for n in full_names if not (owner and n.lower().startswith(owner.lower() + "/"))]
+
+
+def _next_link(link: str) -> str:
+    #.. Link: <https://api.github.com/user/repos?page=2&per_page=100>; rel="next", <...>; rel="last"
+    for part in link.split(","):
+        if 'rel="next"' in part:
+            return part[part.find("<") + 1:part.find(">")]
+    return ""
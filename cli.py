@@ -0,0 +1,286 @@
+"""
+Headless entry point, for cron jobs and CI runners (no PyQt6, no display needed).
+
+    python cli.py update --user FonixArdent --repo Git-Progress --status finished
+    python cli.py batch manifest.json --workers 16 --json
+    python cli.py local path/to/clone --status finished
+    python cli.py repos --full
+    python cli.py audit --manifest manifest.yaml
+    python cli.py watch progress.yaml --workers 50
+
+The token comes from --token, then $GITHUB_TOKEN, then the config.ini saved by the app.
+Modules are imported by the command that needs them, so `--help` stays instant.
+"""
+import os
+import sys
+import json
+import argparse
+import configparser
+
+STATUSES = ("under_dev", "ready_soon", "finished", "under_update")
+
+
+def resolve_credentials(user: str, token: str) -> tuple:
+    """Fills the user / token that were not given with $GITHUB_TOKEN and the app's config.ini."""
+    token = token or os.getenv("GITHUB_TOKEN", "")
+    if user and token:
+        return user, token
+
+    from cache import CONFIG_DIR
+
+    config = configparser.ConfigParser()
+    config.read(os.path.join(CONFIG_DIR, "config.ini"))
+    if "USER" in config:
+        user = user or config["USER"].get("username", "")
+        token = token or config["USER"].get("token", "")
+    return user, token
+
+
+def emit(data: dict, as_json: bool):
+    if as_json:
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'✅' if data['ok'] else '❌'} {data['repo']} [{data['outcome']}] {data['message'].strip()}")
+
+
+def reporter(args):
+    """--verbose streams every phase on stderr, stdout keeps only the result."""
+    if not args.verbose:
+        return None
+    from reporters import StreamReporter
+    return StreamReporter(sys.stderr, as_json=args.json)
+
+
+def inventory(args, token: str, always: bool = False, full: bool = False):
+    """--inventory: refreshed RepoInventory (one listing instead of one get_repo per repository)."""
+    if not (args.inventory or always) or not token:
+        return None
+    from cache import RepoInventory
+    from client import get_client
+
+    repos = RepoInventory()
+    repos.refresh(get_client(token), full=full)
+    repos.save()
+    return repos
+
+
+def token_pool(args, token: str):
+    """--credentials: TokenPool of the file's tokens / App installations and of `token`, None without it."""
+    if not args.credentials:
+        return None
+    from credentials import load_pool
+    return load_pool(args.credentials, [token])
+
+
+def export_metrics(tracer, path: str):
+    if path:
+        tracer.export(path)
+
+
+def cmd_update(args) -> int:
+    user, token = resolve_credentials(args.user, args.token)
+    repo = args.repo
+    if "/" in repo:
+        user, repo = repo.split("/", 1)
+
+    if not token:
+        print("❌ Missing token (use --token, $GITHUB_TOKEN or save it once from the app)", file=sys.stderr)
+        return 2
+
+    from github_edit import Master
+
+    Call = Master((user, token, repo, args.status, args.visibility), reporter(args), force=args.force,
+                  inventory=inventory(args, token))
+    ok = Call.GitEditTree() if args.all_files else Call.GitEdit()
+    if Call.Inventory is not None:
+        Call.Inventory.save()
+    code, message = Call.LastReport
+    emit({"repo": f"{user}/{repo}", "status": args.status, "ok": ok, "outcome": Call.Outcome,
+          "code": code, "message": message, "phases": Call.Tracer.summary()}, args.json)
+    export_metrics(Call.Tracer, args.metrics_out)
+    return 0 if ok else 1
+
+
+def manifest(path: str) -> tuple:
+    """fleet.load_manifest, exiting with 2 on an invalid manifest (like argparse does for bad options)."""
+    from fleet import load_manifest
+
+    try:
+        return load_manifest(path)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        raise SystemExit(2)
+
+
+def cmd_batch(args) -> int:
+    from fleet import Fleet, print_report
+
+    user, token, entries = manifest(args.manifest)
+    user, token = resolve_credentials(args.user or user, args.token or token)
+    pool = token_pool(args, token)
+    if not token and pool is None:
+        print("❌ Missing token (use --token, $GITHUB_TOKEN, --credentials or the manifest)", file=sys.stderr)
+        return 2
+
+    journal = None
+    if not args.no_journal:
+        from journal import JobJournal
+        journal = JobJournal()
+
+    runner = Fleet(user, token, entries, args.workers, force=args.force, all_files=args.all_files,
+                   reporter=reporter(args), inventory=inventory(args, token), pool=pool, journal=journal)
+    report = runner.Run()
+    export_metrics(runner.Tracer, args.metrics_out)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    return 0 if report["totals"]["failed"] == 0 else 1
+
+
+def cmd_local(args) -> int:
+    from local_edit import LocalMaster
+
+    Call = LocalMaster(args.path, args.status, branch=args.branch, push=not args.no_push)
+    ok = Call.GitEdit()
+    code, message = Call.LastReport
+    emit({"repo": args.path, "status": args.status, "ok": ok, "outcome": Call.Outcome, "code": code,
+          "message": message, "commit": Call.Commit, "files": Call.Changed}, args.json)
+    return 0 if ok else 1
+
+
+def cmd_watch(args) -> int:
+    from fleet import print_report
+    from watch import ManifestWatcher
+
+    manifest_user, manifest_token, _ = manifest(args.manifest)
+    user, token = resolve_credentials(args.user or manifest_user, args.token or manifest_token)
+    pool = token_pool(args, token)
+    if not token and pool is None:
+        print("❌ Missing token (use --token, $GITHUB_TOKEN, --credentials or the manifest)", file=sys.stderr)
+        return 2
+
+    on_report = (lambda report: print(json.dumps(report, ensure_ascii=False))) if args.json else print_report
+    watcher = ManifestWatcher(args.manifest, user, token, args.workers, args.debounce, reporter(args),
+                              inventory(args, token), on_report, pool)
+    print(f"👀 Watching {args.manifest} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        watcher.Run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        export_metrics(watcher.Tracer, args.metrics_out)
+    return 0
+
+
+def cmd_repos(args) -> int:
+    user, token = resolve_credentials(args.user, args.token)
+    if not token:
+        print("❌ Missing token (use --token, $GITHUB_TOKEN or save it once from the app)", file=sys.stderr)
+        return 2
+
+    repos = inventory(args, token, always=True, full=args.full)
+    entries = [repos.get(name if "/" in name else f"{user}/{name}") for name in repos.names(user)]
+    if args.json:
+        print(json.dumps(entries, ensure_ascii=False, indent=2))
+    else:
+        for entry in entries:
+            print(f"{'🔒' if entry['private'] else '🌐'} {entry['full_name']}")
+    return 0
+
+
+def cmd_audit(args) -> int:
+    from audit import Audit, print_table
+
+    user, token = args.user, args.token
+    names = list(args.repos)
+    if args.manifest:
+        user, token, entries = manifest(args.manifest)
+        user, token = args.user or user, args.token or token
+        names += [repo for repo, _, _ in entries]
+    user, token = resolve_credentials(user, token)
+    if not token:
+        print("❌ Missing token (use --token, $GITHUB_TOKEN or the manifest)", file=sys.stderr)
+        return 2
+
+    if not names:
+        names = inventory(args, token, always=True).names(user)
+    runner = Audit(token, [name if "/" in name else f"{user}/{name}" for name in names], args.batch)
+    report = runner.Run()
+    export_metrics(runner.Tracer, args.metrics_out)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_table(report)
+    return 0 if report["totals"]["errors"] == 0 else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="Update the Progress line of GitHub READMEs.")
+    parser.add_argument("--user", default="", help="GitHub user owning the repositories")
+    parser.add_argument("--token", default="", help="personal access token")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    parser.add_argument("--verbose", action="store_true", help="print every phase of every update on stderr")
+    parser.add_argument("--inventory", action="store_true",
+                        help="refresh the repository inventory first and check repositories from it")
+    parser.add_argument("--force", action="store_true", help="ignore the local status index, always check README")
+    parser.add_argument("--all-files", action="store_true",
+                        help="rewrite every marked README / docs file in one commit (Git Data API)")
+    parser.add_argument("--metrics-out", default="",
+                        help="write per-phase metrics to this file (JSON lines, or Prometheus text for .prom)")
+    parser.add_argument("--credentials", default="",
+                        help="JSON / YAML / TOML file of extra tokens and GitHub App installations (batch, watch)")
+    parser.add_argument("--pool-size", type=int, default=0, help="keep-alive connections to the GitHub API")
+    parser.add_argument("--timeout", type=int, default=0, help="seconds before a GitHub request is abandoned")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    update = commands.add_parser("update", help="update one repository")
+    update.add_argument("--repo", required=True, help="repo-name or owner/repo-name")
+    update.add_argument("--status", required=True, choices=STATUSES)
+    update.add_argument("--visibility", default="public", choices=("public", "private"))
+    update.set_defaults(func=cmd_update)
+
+    batch = commands.add_parser("batch", help="update every repository of a fleet manifest")
+    batch.add_argument("manifest", help="JSON, YAML or TOML manifest (see fleet.py)")
+    batch.add_argument("--workers", type=int, default=8, help="concurrent updates")
+    batch.add_argument("--no-journal", action="store_true",
+                       help="do not record the run, an interrupted run is not resumed (see journal.py)")
+    batch.set_defaults(func=cmd_batch)
+
+    local = commands.add_parser("local", help="update every README of a local clone or bare mirror, one push")
+    local.add_argument("path", help="working copy or bare repository")
+    local.add_argument("--status", required=True, choices=STATUSES)
+    local.add_argument("--branch", default=None, help="branch to commit on (default: current / HEAD)")
+    local.add_argument("--no-push", action="store_true", help="commit only")
+    local.set_defaults(func=cmd_local)
+
+    watch = commands.add_parser("watch", help="publish a manifest again every time it is saved")
+    watch.add_argument("manifest", help="JSON, YAML or TOML manifest (see fleet.py)")
+    watch.add_argument("--workers", type=int, default=50, help="concurrent updates per batch of changes")
+    watch.add_argument("--debounce", type=float, default=1.0,
+                       help="seconds without a new save before a batch is published")
+    watch.set_defaults(func=cmd_watch)
+
+    repos = commands.add_parser("repos", help="refresh and print the local repository inventory")
+    repos.add_argument("--full", action="store_true", help="walk every page and drop deleted repositories")
+    repos.set_defaults(func=cmd_repos)
+
+    audit = commands.add_parser("audit", help="read the progress line of many repositories, nothing is written")
+    audit.add_argument("repos", nargs="*", help="repo-name or owner/repo-name (default: the whole inventory)")
+    audit.add_argument("--manifest", default="", help="audit the repositories of this manifest")
+    audit.add_argument("--batch", type=int, default=100, help="repositories per GraphQL query (100 at most)")
+    audit.set_defaults(func=cmd_audit)
+
+    return parser
+
+
+def main(argv: list = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.pool_size or args.timeout:
+        from client import CLIENTS
+        CLIENTS.configure(args.pool_size, args.timeout)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
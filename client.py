@@ -0,0 +1,135 @@
+"""
+Process-wide GitHub clients, one per token and API url.
+
+Every Master used to build its own `Github(...)`, so every update paid a new TLS handshake.
+Clients are now kept here and shared by every Master of the process (window, fleet, service):
+the keep-alive connections of their pool are reused from one update to the next.
+
+PyGithub 2.x rebuilds the requests.Session of a Requester before every request, so sharing a
+Github object alone still opens one TCP / TLS connection per call. The connection classes below
+are injected into PyGithub instead: they all send through one pooled session per host.
+"""
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from github import Github
+from github.Requester import Requester, RequestsResponse
+
+DEFAULT_URL = "https://api.github.com"
+
+_sessions_lock = threading.Lock()
+_sessions = {}  # (scheme, host, port) -> (requests.Session, pool_size)
+
+
+def _session(scheme: str, host: str, port: int, pool_size: int, retry) -> requests.Session:
+    """Pooled session of one host, rebuilt only when a larger pool is asked for."""
+    key = (scheme, host, port)
+    with _sessions_lock:
+        session, size = _sessions.get(key, (None, 0))
+        if session is None or size < pool_size:
+            session = requests.Session()
+            session.auth = Requester.noopAuth  # no .netrc fallback, the token is sent per request
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))  # shared by every token
+            adapter = requests.adapters.HTTPAdapter(
+                max_retries=requests.adapters.DEFAULT_RETRIES if retry is None else retry,
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+            )
+            session.mount(f"{scheme}://", adapter)
+            _sessions[key] = (session, pool_size)
+        return session
+
+
+class PooledHTTPSConnection:
+    """httplib-like connection handed to PyGithub, backed by the shared session of its host."""
+    protocol = "https"
+    default_port = 443
+
+    def __init__(self, host: str, port: int = None, strict: bool = False, timeout: int = None,
+                 retry=None, pool_size: int = None, **kwargs):
+        self.host = host
+        self.port = port if port else self.default_port
+        self.timeout = timeout
+        self.verify = kwargs.get("verify", True)
+        self.session = _session(self.protocol, host, self.port,
+                                pool_size or requests.adapters.DEFAULT_POOLSIZE, retry)
+
+    def request(self, verb: str, url: str, input=None, headers: dict = None, stream: bool = False):
+        self.verb, self.url, self.input, self.headers, self.stream = verb, url, input, headers, stream
+
+    def getresponse(self) -> RequestsResponse:
+        r = self.session.request(
+            self.verb, f"{self.protocol}://{self.host}:{self.port}{self.url}",
+            headers=self.headers, data=self.input, timeout=self.timeout, verify=self.verify,
+            stream=self.stream, allow_redirects=False,
+        )
+        return RequestsResponse(r)
+
+    def close(self):
+        pass  #.. The session outlives this request, its connections stay open for the next ones
+
+
+class PooledHTTPConnection(PooledHTTPSConnection):
+    protocol = "http"
+    default_port = 80
+
+
+Requester.injectConnectionClasses(PooledHTTPConnection, PooledHTTPSConnection)
+
+
+class ClientPool:
+    """
+    Github clients keyed by (token, base_url).
+        pool_size   keep-alive connections per client, raise it to the number of concurrent workers
+        timeout     seconds before a request to the API is abandoned
+    A caller asking for a larger pool than the cached client has gets a new, larger client.
+    """
+    def __init__(self, pool_size: int = 10, timeout: int = 15):
+        self.PoolSize = pool_size
+        self.Timeout = timeout
+
+        self._lock = threading.Lock()
+        self._clients = {}  # (token, base_url) -> (Github, pool_size)
+
+    def configure(self, pool_size: int = None, timeout: int = None):
+        """Changes the defaults of the clients created from now on."""
+        with self._lock:
+            if pool_size:
+                self.PoolSize = pool_size
+            if timeout:
+                self.Timeout = timeout
+
+    def get(self, token: str, base_url: str = DEFAULT_URL, pool_size: int = None) -> Github:
+        key = (token, base_url)
+        with self._lock:
+            pool_size = max(pool_size or 0, self.PoolSize)
+            client, size = self._clients.get(key, (None, 0))
+            if client is None or size < pool_size:
+                #.. Pacing and retries are done by RateScheduler, not by PyGithub itself
+                client = Github(login_or_token=token, base_url=base_url, retry=None, pool_size=pool_size,
+                                timeout=self.Timeout, seconds_between_requests=None, seconds_between_writes=None)
+                self._clients[key] = (client, pool_size)
+            return client
+
+    def drop(self, token: str):
+        """Forgets the clients of a token that will not be used again (expired installation token)."""
+        with self._lock:
+            self._clients = {key: value for key, value in self._clients.items() if key[0] != token}
+
+    def close(self):
+        with self._lock:
+            self._clients = {}
+        with _sessions_lock:
+            sessions = [session for session, _ in _sessions.values()]
+            _sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+CLIENTS = ClientPool()
+
+
+def get_client(token: str, base_url: str = DEFAULT_URL, pool_size: int = None) -> Github:
+    """Shared client of `token`, created on first use."""
+    return CLIENTS.get(token, base_url, pool_size)
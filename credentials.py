@@ -0,0 +1,166 @@
+"""
+Credential pool: several personal access tokens and GitHub App installations used side by side.
+
+One token is one hourly budget (5000 requests, 15000 for some installations). A pool gives each
+credential its own RateScheduler and sends every update to the credential with the most budget
+left, so batch and service workloads grow with the number of credentials.
+
+Credentials file (JSON, YAML or TOML, see fleet.read_manifest):
+    tokens:
+      - ghp_...
+      - {token: ghp_..., owners: [FonixArdent]}
+    apps:
+      - app_id: 123456
+        installation_id: 7890123
+        private_key: path/to/app.private-key.pem      (path, or the PEM text itself)
+        owners: [my-org]                              (accounts this installation covers)
+
+`owners` is optional: a credential without it is tried for every repository.
+"""
+import os
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import jwt
+from github import Auth, Github
+
+from client import CLIENTS, DEFAULT_URL
+from scheduler import RateScheduler
+
+
+class TokenCredential:
+    """A personal access token, it never has to be renewed."""
+    def __init__(self, token: str, owners: list = ()):
+        self.Token = token
+        self.Owners = {owner.lower() for owner in owners}
+        self.Name = f"token …{token[-4:]}"
+
+    def token(self) -> str:
+        return self.Token
+
+
+class AppCredential:
+    """
+    One installation of a GitHub App. Its installation token is minted with a JWT signed by the
+    App private key, then reused until `Margin` seconds before it expires (tokens live one hour).
+    """
+    JwtLifetime = 540  # GitHub refuses JWTs valid for more than 10 minutes
+    Margin = 300
+
+    def __init__(self, app_id, installation_id, private_key: str, owners: list = (), base_url: str = DEFAULT_URL):
+        self.AppId = str(app_id)
+        self.InstallationId = int(installation_id)
+        self.PrivateKey = private_key
+        self.Owners = {owner.lower() for owner in owners}
+        self.BaseUrl = base_url
+        self.Name = f"app {self.AppId}/{self.InstallationId}"
+
+        self._lock = threading.Lock()  # one mint at a time, the other workers wait for its token
+        self._token = ""
+        self._expires = 0.0
+
+    def app_jwt(self) -> str:
+        now = int(time.time())
+        #.. Issued a minute in the past, against clock drift between this machine and GitHub
+        return jwt.encode({"iat": now - 60, "exp": now + self.JwtLifetime, "iss": self.AppId},
+                          self.PrivateKey, algorithm="RS256")
+
+    def _mint(self) -> tuple:
+        GitHub = Github(auth=Auth.AppAuthToken(self.app_jwt()), base_url=self.BaseUrl)
+        _, data = GitHub.requester.requestJsonAndCheck(
+            "POST", f"/app/installations/{self.InstallationId}/access_tokens")
+        expires = datetime.fromisoformat(data["expires_at"].replace("Z", "+00:00")).timestamp()
+        return data["token"], expires
+
+    def token(self) -> str:
+        """Cached installation token, minted again when it is about to expire."""
+        with self._lock:
+            if time.time() < self._expires - self.Margin:
+                return self._token
+            #.. Not through the installation's RateScheduler: JWT requests have a budget of their own
+            expired = self._token
+            self._token, self._expires = self._mint()
+
+        if expired:
+            CLIENTS.drop(expired)
+        return self._token
+
+
+class TokenPool:
+    """
+    Credentials with one RateScheduler each. `lease(owner)` picks the credential that can reach
+    `owner` with the most remaining budget, minus the updates it is already running.
+    """
+    def __init__(self, credentials: list, scheduler_factory=RateScheduler):
+        if not credentials:
+            raise ValueError("A token pool needs at least one credential")
+        self.Credentials = list(credentials)
+        self.Schedulers = [scheduler_factory() for _ in self.Credentials]
+
+        self._lock = threading.Lock()
+        self._leases = [0] * len(self.Credentials)
+        self._turn = 0  # ties go round-robin
+
+    def _score(self, i: int) -> float:
+        budget = self.Schedulers[i].budget()
+        if budget["paused_for"] > 0:  # exhausted until its reset, or backing off
+            return -budget["paused_for"]
+        #.. Never used yet: unknown budget, try it before the ones already spending theirs
+        remaining = float("inf") if budget["remaining"] < 0 else budget["remaining"]
+        return remaining - self._leases[i]
+
+    @contextmanager
+    def lease(self, owner: str = ""):
+        """(token, scheduler) for one update of a repository of `owner`."""
+        count = len(self.Credentials)
+        with self._lock:
+            candidates = [i for i, credential in enumerate(self.Credentials)
+                          if not credential.Owners or owner.lower() in credential.Owners] or range(count)
+            i = max(candidates, key=lambda i: (self._score(i), -((i - self._turn) % count)))
+            self._turn = i + 1
+            self._leases[i] += 1
+        try:
+            yield self.Credentials[i].token(), self.Schedulers[i]
+        finally:
+            with self._lock:
+                self._leases[i] -= 1
+
+    def budget(self) -> dict:
+        """Summed budget of the credentials seen so far, and the detail of each one."""
+        budgets = [{"credential": credential.Name, **scheduler.budget()}
+                   for credential, scheduler in zip(self.Credentials, self.Schedulers)]
+        known = [budget for budget in budgets if budget["remaining"] >= 0]
+        return {
+            "remaining": sum(budget["remaining"] for budget in known) if known else -1,
+            "limit": sum(budget["limit"] for budget in known) if known else -1,
+            "credentials": budgets,
+        }
+
+
+def _private_key(value: str, folder: str) -> str:
+    if value.lstrip().startswith("-----BEGIN"):
+        return value
+    with open(os.path.join(folder, os.path.expanduser(value)), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def load_pool(path: str = "", tokens: list = (), base_url: str = DEFAULT_URL,
+              scheduler_factory=RateScheduler) -> TokenPool:
+    """TokenPool of a credentials file plus `tokens` (e.g. the --token / saved one), None when both are empty."""
+    from fleet import read_manifest
+
+    credentials = [TokenCredential(token) for token in tokens if token]
+    if path:
+        data, folder = read_manifest(path), os.path.dirname(os.path.abspath(path))
+        for item in data.get("tokens", []):
+            item = item if isinstance(item, dict) else {"token": item}
+            if item["token"] not in [c.Token for c in credentials if isinstance(c, TokenCredential)]:
+                credentials.append(TokenCredential(item["token"], item.get("owners", ())))
+        for item in data.get("apps", []):
+            credentials.append(AppCredential(item["app_id"], item["installation_id"],
+                                             _private_key(item["private_key"], folder),
+                                             item.get("owners", ()), base_url))
+
+    return TokenPool(credentials, scheduler_factory) if credentials else None
@@ -0,0 +1,260 @@
+import os
+import sys
+import json
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from github_edit import Master
+from cache import RepoCache, StatusIndex, RepoInventory
+from scheduler import RateScheduler
+from metrics import Tracer
+from client import DEFAULT_URL, get_client
+from rewrite import PROGRESS_MAP
+from journal import JobJournal, plan_key
+
+
+def read_manifest(path: str) -> dict:
+    #.. JSON, YAML (.yml / .yaml) or TOML (.toml), picked by extension
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if extension in (".yml", ".yaml"):
+        import yaml
+        try:
+            return yaml.safe_load(raw) or {}
+        except yaml.YAMLError as e:  # JSON and TOML decode errors already are ValueErrors
+            raise ValueError(str(e)) from e
+    if extension == ".toml":
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import toml
+            return toml.loads(raw.decode("utf-8"))
+        return tomllib.loads(raw.decode("utf-8"))
+    return json.loads(raw)
+
+
+def load_manifest(path: str) -> tuple:
+    """
+    Reads a fleet manifest (JSON, YAML or TOML) and returns (user, token, entries).
+    Expected shape:
+        {
+            "user": "FonixArdent",
+            "token": "ghp_...",            (optional, can be given on the command line)
+            "repos": [
+                {"repo": "Git-Progress", "status": "finished", "visibility": "public"},
+                ...
+            ]
+        }
+    "repos" may also map names to a status or to {status, visibility}, e.g. in YAML:
+        repos:
+          Git-Progress: finished
+          Other-Repo: {status: under_dev, visibility: private}
+    "visibility" defaults to "public" and "repo" may also be written as "owner/repo".
+    Raises ValueError, listing every problem, for a file that does not parse, an entry without
+    repo or status, an unknown status or visibility and a repository listed twice.
+    """
+    file_name = os.path.basename(path)
+    try:
+        manifest = read_manifest(path)
+    except ValueError as e:
+        details = str(e).strip().replace("\n", "\n  ")
+        raise ValueError(f"Invalid manifest {file_name}:\n  {details}") from e
+    if not isinstance(manifest, dict):
+        raise ValueError(f"Invalid manifest {file_name}:\n  expected a mapping with 'user' and 'repos'")
+    user = manifest.get("user", "")
+
+    repos = manifest.get("repos", [])
+    if isinstance(repos, dict):
+        repos = [{"repo": name, **(value if isinstance(value, dict) else {"status": value})}
+                 for name, value in repos.items()]
+    if not isinstance(repos, list):
+        raise ValueError(f"Invalid manifest {file_name}:\n  'repos' must be a list or a mapping")
+
+    entries, seen, problems = [], set(), []
+    for number, item in enumerate(repos, 1):
+        if not isinstance(item, dict) or not all(isinstance(item.get(key), str) for key in ("repo", "status")):
+            problems.append(f"entry {number}: expected {{repo, status[, visibility]}}, got {item!r}")
+            continue
+        repo, status, visibility = item["repo"], item["status"], item.get("visibility", "public")
+        full_name = (repo if "/" in repo else f"{user}/{repo}").lower()
+        if status not in PROGRESS_MAP:
+            problems.append(f"{repo}: unknown status '{status}' (expected one of {', '.join(PROGRESS_MAP)})")
+        if visibility not in ("public", "private"):
+            problems.append(f"{repo}: unknown visibility '{visibility}' (expected public or private)")
+        if full_name in seen:
+            problems.append(f"{repo}: listed more than once")
+        seen.add(full_name)
+        entries.append((repo, status, visibility))
+
+    if problems:
+        raise ValueError(f"Invalid manifest {file_name}:\n  " + "\n  ".join(problems))
+    return user, manifest.get("token", ""), entries
+
+
+class Fleet:
+    """
+    Fleet runs the Master update pipeline (GitCheck -> get_readme -> rewrite -> update_file)
+    for many repositories at once on a bounded worker pool.
+    """
+    def __init__(self, user: str, token: str, entries: list, workers: int = 8, cache: RepoCache = None,
+                 scheduler: RateScheduler = None, index: StatusIndex = None, force: bool = False,
+                 all_files: bool = False, base_url: str = DEFAULT_URL, tracer: Tracer = None,
+                 reporter=None, inventory: RepoInventory = None, pool=None, journal: JobJournal = None):
+        self.GitUser = user
+        self.TOKEN = token
+        self.Entries = entries
+        self.Workers = max(1, workers)
+        self.Cache = cache if cache is not None else RepoCache()
+        #.. One token means one budget: every worker goes through the same scheduler
+        self.Scheduler = scheduler if scheduler is not None else RateScheduler()
+        #.. Repos already showing the requested status are skipped offline unless `force`
+        self.Index = index if index is not None else StatusIndex()
+        self.Force = force
+        #.. Every marked file of a repo in one commit (GitEditTree) instead of the README only
+        self.AllFiles = all_files
+        self.BaseUrl = base_url  # GitHub Enterprise, or the fake API of benchmarks/
+        #.. One keep-alive connection per worker in the shared client, every Master reuses it
+        get_client(token, base_url, pool_size=self.Workers)
+        self.Tracer = tracer if tracer is not None else Tracer()
+        #.. Repositories listed in the inventory are checked without a get_repo request
+        self.Inventory = inventory
+        self.Reporter = reporter  # shared by every Master, None keeps the run quiet (reporters.py)
+        #.. credentials.TokenPool: each update takes the credential with the most budget left,
+        #.. `token` and `scheduler` are then unused
+        self.Pool = pool
+        #.. Durable per-repository states: an interrupted run of the same manifest resumes
+        self.Journal = journal
+        self.RunId = None
+
+    def _target(self, repo: str) -> tuple:
+        #.. "owner/repo" entries override the fleet user
+        return tuple(repo.split("/", 1)) if "/" in repo else (self.GitUser, repo)
+
+    def _update(self, entry: tuple) -> dict:
+        repo, status, visibility = entry
+        user, repo = self._target(repo)
+
+        started = time.perf_counter()
+        if self.Journal is not None:
+            self.Journal.start(self.RunId, f"{user}/{repo}")
+        Call = None
+        lease = self.Pool.lease(user) if self.Pool is not None else nullcontext((self.TOKEN, self.Scheduler))
+        try:
+            with lease as (token, scheduler):
+                Call = Master((user, token, repo, status, visibility), self.Reporter, cache=self.Cache,
+                              scheduler=scheduler, index=self.Index, force=self.Force,
+                              base_url=self.BaseUrl, tracer=self.Tracer, inventory=self.Inventory)
+                ok = Call.GitEditTree() if self.AllFiles else Call.GitEdit()
+            outcome, (code, message) = Call.Outcome, Call.LastReport
+        except Exception as e:  # Master reports its own errors, this is the credential (installation token not minted)
+            ok, outcome, code, message = False, "failed", 101, f"❌ No usable credential : {e}"
+
+        commit = Call.Commit if Call is not None else None
+        if self.Journal is not None:
+            self.Journal.finish(self.RunId, f"{user}/{repo}", ok, outcome, commit, message)
+
+        return {
+            "repo": f"{user}/{repo}",
+            "status": status,
+            "ok": ok,
+            "outcome": outcome,
+            "code": code,
+            "message": message,
+            "commit": commit,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    def _resumed(self, entry: tuple, done: dict) -> dict:
+        user, repo = self._target(entry[0])
+        commit = f" (commit {done['commit'][:7]})" if done["commit"] else ""
+        return {
+            "repo": f"{user}/{repo}",
+            "status": entry[1],
+            "ok": True,
+            "outcome": "resumed",
+            "code": 20,
+            "message": f"⏭️ Done by the interrupted run{commit}: {done['message'].strip()}",
+            "commit": done["commit"],
+            "seconds": 0.0,
+        }
+
+    def _plan(self) -> tuple:
+        """(entries left to run, results of the entries an interrupted run already completed)."""
+        if self.Journal is None:
+            return self.Entries, []
+
+        jobs = [("/".join(self._target(repo)), status, visibility) for repo, status, visibility in self.Entries]
+        self.RunId, done = self.Journal.open_run(
+            plan_key(self.GitUser, self.Entries, "tree" if self.AllFiles else "readme"), jobs)
+        pending = [entry for entry, job in zip(self.Entries, jobs) if job[0] not in done]
+        resumed = [self._resumed(entry, done[job[0]]) for entry, job in zip(self.Entries, jobs) if job[0] in done]
+        return pending, resumed
+
+    def Run(self) -> dict:
+        started = time.perf_counter()
+        pending, results = self._plan()
+
+        with ThreadPoolExecutor(max_workers=self.Workers) as pool:
+            futures = [pool.submit(self._update, entry) for entry in pending]
+            for future in as_completed(futures):
+                results.append(future.result())
+
+        if self.Journal is not None:
+            self.Journal.close_run(self.RunId)
+        self.Cache.save()
+        self.Index.save()
+        if self.Inventory is not None:
+            self.Inventory.save()
+
+        wall = time.perf_counter() - started
+        outcomes = [r["outcome"] for r in results]
+
+        return {
+            "results": sorted(results, key=lambda r: r["repo"]),
+            "totals": {
+                "repos": len(results),
+                "updated": outcomes.count("updated"),
+                "unchanged": outcomes.count("unchanged"),
+                "skipped": outcomes.count("skipped"),
+                "failed": outcomes.count("failed"),
+                "resumed": outcomes.count("resumed"),
+                "workers": self.Workers,
+                "wall_seconds": round(wall, 3),
+                "repos_per_second": round(len(results) / wall, 2) if wall > 0 else 0.0,
+            },
+            "budget": self.Pool.budget() if self.Pool is not None else self.Scheduler.budget(),
+            "phases": self.Tracer.summary(),
+            "events": self.Tracer.events(),
+        }
+
+
+def print_report(report: dict):
+    for r in report["results"]:
+        print(f"{'✅' if r['ok'] else '❌'} {r['repo']:<40} {r['seconds']:>7.2f}s  {r['message'].strip()}")
+
+    totals = report["totals"]
+    print(
+        f"\n💠 {totals['updated']}/{totals['repos']} updated, {totals['unchanged']} unchanged, "
+        f"{totals['skipped']} skipped, {totals['failed']} failed"
+        f"{', %d resumed' % totals['resumed'] if totals.get('resumed') else ''} "
+        f"in {totals['wall_seconds']}s ({totals['repos_per_second']} repos/s, {totals['workers']} workers)"
+    )
+    print(f"💠 Rate limit : {report['budget']['remaining']}/{report['budget']['limit']} remaining")
+
+
+if __name__ == "__main__":
+    #.. Usage: python fleet.py manifest.json [token] [workers]
+    if len(sys.argv) < 2:
+        print("Usage: python fleet.py manifest.json [token] [workers]")
+        sys.exit(2)
+
+    user, token, entries = load_manifest(sys.argv[1])
+    token = sys.argv[2] if len(sys.argv) > 2 else token
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+    report = Fleet(user, token, entries, workers).Run()
+    print_report(report)
+    sys.exit(0 if report["totals"]["failed"] == 0 else 1)
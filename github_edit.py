@@ -1,96 +1,373 @@
 import time
-import re
 import base64
-from github import Github
+import random
+import fnmatch
+from github import InputGitTreeElement
 from github.GithubException import GithubException
-from boxes import show_box  # Custom error/info display
+from cache import RepoCache, StatusIndex, RepoInventory
+from scheduler import RateScheduler
+from metrics import Tracer
+from client import DEFAULT_URL, get_client
+from reporters import NullReporter
+from rewrite import PROGRESS_MAP, rewrite_progress, find_progress
+
+# Files (lower case, fnmatch) GitEditTree looks at for the progress marker
+TREE_PATTERNS = ("readme.md", "*/readme.md", "docs/*.md")
+
+
+def is_conflict(error: Exception) -> bool:
+    """True when a write lost a race: README sha mismatch (409 / 422) or a ref that moved (422)."""
+    if not isinstance(error, GithubException) or error.status not in (409, 422):
+        return False
+    message = str(error.data).lower() if error.data else ""
+    return error.status == 409 or "sha" in message or "fast forward" in message
+
+
+class GitCancelled(Exception):
+    """Raised between two pipeline phases when the caller asked to stop the update."""
+
 
 class Master:
     """
     Master class for managing and updating the progression status of a GitHub repository's README.
     """
-    def __init__(self, data: tuple):
+    def __init__(self, data: tuple, reporter=None, cache: RepoCache = None, cancel=None,
+                 scheduler: RateScheduler = None, index: StatusIndex = None, force: bool = False,
+                 base_url: str = DEFAULT_URL, tracer: Tracer = None, inventory: RepoInventory = None,
+                 prepared: dict = None):
         USER: str = data[0]
         REPO: str = data[2]
         STATUS: str = data[3]
         VISIBILITY: str = data[4]
 
-        TYPE = {"🌐 Public": "public", "🔒 Private": "private"}
+        TYPE = {"🌐 Public": "public", "🔒 Private": "private", "public": "public", "private": "private"}
 
         self.TOKEN: str = data[1]
         self.GitUser = USER
         self.GitData = (REPO, STATUS, TYPE.get(VISIBILITY, "public"))
-        self.GitHub = Github(login_or_token=self.TOKEN)
+        self.FullName = f"{USER}/{REPO}"
+        #.. Shared client of this token (client.py): keep-alive connections outlive this Master
+        self.GitHub = get_client(self.TOKEN, base_url)
+        self.Scheduler = scheduler if scheduler is not None else RateScheduler()
+
+        #.. Messages go to a non-blocking reporter (reporters.py), the last one is kept in LastReport
+        self.Reporter = reporter if reporter is not None else NullReporter()
+        self.LastReport = (0, "")
+
+        #.. Repo/README metadata cache, shared when several Masters run together
+        self.OwnsCache = cache is None
+        self.Cache = cache if cache is not None else RepoCache()
+        self.Repo = None
+        self.RepoMeta = {}
+
+        #.. Result of a speculative Prefetch (repo checked, README read): the edit starts from it
+        self.Prepared = prepared
+        if prepared is not None:
+            self.Repo, self.RepoMeta = prepared["repo"], prepared["meta"]
+
+        #.. Optional RepoInventory: known repositories are checked without any request
+        self.Inventory = inventory
+
+        #.. Last applied status per repo: `force` still checks the README but ignores the index
+        self.OwnsIndex = index is None
+        self.Index = index if index is not None else StatusIndex()
+        self.Force = force
+        self.Outcome = "pending"  # updated / unchanged / skipped / failed
+        self.Commit = None  # sha of the commit made by the last update
+
+        #.. Someone else committed between our read and our write: read again, rewrite, retry
+        self.ConflictRetries = 4
+        self.ConflictBackoff = 0.5
+
+        #.. GUI worker hook: `cancel` is a threading.Event checked between phases
+        self.CancelEvent = cancel
+
+        #.. Per-phase durations / bytes / API calls, shared by the caller to aggregate a run
+        self.Tracer = tracer if tracer is not None else Tracer()
+
+    def _report(self, code: int, data=None):
+        self.LastReport = (code, "" if data is None else str(data))
+        self.Reporter.report(code, self.LastReport[1], self.FullName)
+
+    def _call(self, record: dict, func, *args, write: bool = False, **kwargs):
+        #.. API call through the scheduler, every attempt (retries included) counted in the span
+        def attempt(*a, **kw):
+            record["api_calls"] += 1
+            return func(*a, **kw)
+        return self.Scheduler.call(self.GitHub, attempt, *args, write=write, **kwargs)
+
+    def _phase(self, text: str):
+        #.. Every phase is also a cancellation point, nothing is left half written
+        if self.CancelEvent is not None and self.CancelEvent.is_set():
+            raise GitCancelled(f"🛑 Update of '{self.GitData[0]}' cancelled.")
+        self.Reporter.progress(text, self.FullName)
 
     def GitCheck(self) -> bool:
         try:
-            repo = self.GitHub.get_repo(f"{self.GitUser}/{self.GitData[0]}")
-           # print(f"✅ Repository found: {repo.full_name}") >> test
+            self._phase(f"🔎 Checking repository '{self.FullName}'...")
+            meta = self.Inventory.get(self.FullName) if self.Inventory is not None else None
+            if meta is not None and meta["private"] == (self.GitData[2] == "private"):
+                #.. Known and matching the selected visibility: the lazy Repository costs no request
+                self.Repo, self.RepoMeta = self.GitHub.get_repo(self.FullName, lazy=True), meta
+                return True
+
+            #.. Unknown, or the inventory may predate a visibility change: GitHub decides
+            with self.Tracer.span("get_repo", self.FullName) as record:
+                self.RepoMeta = self._call(record, self.Cache.repo, self.GitHub, self.FullName)
+            #.. Built from this Master's client, so writes go out with the token it was given
+            self.Repo = self.GitHub.get_repo(self.FullName, lazy=True)
+            if self.Inventory is not None:
+                self.Inventory.note(self.RepoMeta)
+           # print(f"✅ Repository found: {self.RepoMeta['full_name']}") >> test
             return True
+        except GitCancelled as e:
+            self._report(499, e)
+            return False
         except GithubException as e:
-            show_box(e.status if e.status in (404, 403) else 505, e)
+            self._report(e.status if e.status in (404, 403) else 505, e)
             return False
         except Exception as e:
-            show_box(101, e)
+            self._report(101, e)
             return False
 
-    def GitEdit(self):
-        if not self.GitCheck():
-            show_box(0, f"\n\n>> {__name__} : GitCheck Failed\n\n💠 Please try again.")
-            return
+    def _run(self, edit, mode: str = "readme") -> bool:
+        """Shared frame of the update modes: index skip, GitCheck, visibility check, error reporting."""
+        progress_value = PROGRESS_MAP.get(self.GitData[1], "📛 Unknown")
+        self.Outcome = "failed"
+
+        #.. Nothing to do and no request at all when the index says this status is already applied
+        if not self.Force and self.Index.is_current(self.FullName, progress_value, self.GitData[2], mode):
+            self.Outcome = "skipped"
+            self.Tracer.outcome(self.Outcome)
+            self._report(20, f"💤 '{self.GitData[0]}' already shows '{progress_value}', nothing to update.")
+            return True
+
+        if self.Repo is None and not self.GitCheck():  #.. A prefetched Master is already checked
+            #.. LastReport keeps the reason given by GitCheck
+            self.Tracer.outcome(self.Outcome)
+            return False
 
         try:
-            repo = self.GitHub.get_repo(f"{self.GitUser}/{self.GitData[0]}")
-            is_private = repo.private
-            expected_visibility = self.GitData[2]
-
-            #.. Check repository visibility
-            if expected_visibility == "public" and is_private:
-                show_box(403, f"❌ The repository '{self.GitData[0]}' is private, but you selected 'Public'.")
-                return
-
-            if expected_visibility == "private" and not is_private:
-                show_box(403, f"❌ The repository '{self.GitData[0]}' is public, but you selected 'Private'.")
-                return
-
-            show_box(20, f"✍️ Preparing to update the {expected_visibility} repository '{self.GitData[0]}'...")
-
-            readme_file = repo.get_readme()
-            content_decoded = base64.b64decode(readme_file.content).decode("utf-8")
-
-            progress_map = {
-                "under_dev": "🔴 Under Development",
-                "ready_soon": "🟠 Soon Ready",
-                "finished": "🟢 Ended",
-                "under_update": "🔘 Updating",
-            }
-            progress_value = progress_map.get(self.GitData[1], "📛 Unknown")
-
-            #.. Update the progression line in the README
-            pattern = re.compile(r'^([ >\<\-\*\`]*progress\s*:\s*)(.*?)([ >\<\-\*\`]*)$', re.IGNORECASE | re.MULTILINE)
-
-            def replace_progression(match):
-                prefix = match.group(1)
-                suffix = match.group(3)
-                return f"{prefix}{progress_value}{suffix}\n"
-
-            if re.search(pattern, content_decoded):
-                updated_content = re.sub(pattern, replace_progression, content_decoded)
-            else:
-                #.. Add the progression line if it does not exist
-                updated_content = content_decoded + f"\n\nProgress : {progress_value}"
-
-            repo.update_file(
-                path=readme_file.path,
+            if not self._check_visibility():
+                return False
+
+            self._phase(f"✍️ Preparing to update the {self.GitData[2]} repository '{self.GitData[0]}'...")
+            return self._retry_conflicts(edit, progress_value)
+
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self.Tracer.outcome(self.Outcome)
+            if self.OwnsCache:
+                self.Cache.save()
+            if self.OwnsIndex:
+                self.Index.save()
+        return False
+
+    def _check_visibility(self) -> bool:
+        is_private = self.RepoMeta["private"]
+        expected_visibility = self.GitData[2]
+
+        #.. Check repository visibility
+        if expected_visibility == "public" and is_private:
+            self._report(403, f"❌ The repository '{self.GitData[0]}' is private, but you selected 'Public'.")
+            return False
+
+        if expected_visibility == "private" and not is_private:
+            self._report(403, f"❌ The repository '{self.GitData[0]}' is public, but you selected 'Private'.")
+            return False
+        return True
+
+    def _fail(self, error: Exception):
+        if isinstance(error, GitCancelled):
+            self._report(499, error)
+        elif isinstance(error, GithubException) and is_conflict(error):
+            self._report(409, f"⚔️ '{self.GitData[0]}' kept changing during the update "
+                              f"({self.ConflictRetries + 1} attempts), please try again.\n\n{error}")
+        elif isinstance(error, GithubException):
+            self._report(error.status if error.status in (403, 404) else 505, error)
+        else:
+            self._report(101, error)
+
+    def _retry_conflicts(self, edit, progress_value: str) -> bool:
+        #.. Optimistic concurrency: the edit re-reads what it rewrites, so running it again on a
+        #.. conflict applies the progress line on top of the other commit instead of losing it
+        attempt = 0
+        while True:
+            try:
+                done = edit(progress_value)
+                if attempt:
+                    self.Tracer.count("conflict_resolved")
+                return done
+            except GithubException as e:
+                if not is_conflict(e):
+                    raise
+                self.Tracer.count("write_conflict")
+                if attempt >= self.ConflictRetries:
+                    self.Tracer.count("conflict_gave_up")
+                    raise
+
+            attempt += 1
+            self.Cache.forget(RepoCache.readme_url(self.FullName))  # read the new README, not a cached one
+            with self.Tracer.span("conflict_wait", self.FullName):
+                time.sleep(random.uniform(0, self.ConflictBackoff * 2 ** attempt))
+            self._phase(f"⚔️ README changed meanwhile, retrying ({attempt}/{self.ConflictRetries})...")
+
+    def Prefetch(self) -> bool:
+        """
+        Speculative first half of GitEdit: GitCheck, visibility check, README read and decode.
+        Nothing is written. On success `Prepared` can be given to the Master that does the edit.
+        """
+        if not self.GitCheck():
+            return False
+        try:
+            if not self._check_visibility():
+                return False
+            readme_file, content = self._read_readme()
+            self.Prepared = {"repo": self.Repo, "meta": self.RepoMeta, "readme": readme_file, "content": content}
+            return True
+        except Exception as e:
+            self._fail(e)
+            return False
+
+    def GitEdit(self) -> bool:
+        """Updates the progress line of the repository README (contents API, one commit)."""
+        return self._run(self._edit_readme)
+
+    def GitEditTree(self, patterns: tuple = TREE_PATTERNS) -> bool:
+        """Updates every file matching `patterns` that carries the progress marker, in one commit."""
+        return self._run(lambda progress_value: self._edit_tree(progress_value, patterns), mode="tree")
+
+    def _read_readme(self) -> tuple:
+        self._phase("📥 Fetching README...")
+        with self.Tracer.span("get_readme", self.FullName) as record:
+            readme_file = self._call(record, self.Cache.readme, self.GitHub, self.FullName)
+            record["bytes"] = len(readme_file["content"] or "")
+        if self.Inventory is not None:
+            self.Inventory.note_readme(self.FullName, readme_file["path"], readme_file["sha"])
+
+        with self.Tracer.span("decode", self.FullName) as record:
+            content = base64.b64decode(readme_file["content"])
+            record["bytes"] = len(content)
+        return readme_file, content
+
+    def _edit_readme(self, progress_value: str) -> bool:
+        repo = self.Repo  #.. Already fetched by GitCheck
+        expected_visibility = self.GitData[2]
+
+        #.. The prefetched README is used once, a conflict retry reads it again
+        prepared, self.Prepared = self.Prepared, None
+        if prepared is not None and "readme" in prepared:
+            readme_file, content = prepared["readme"], prepared["content"]
+        else:
+            readme_file, content = self._read_readme()
+
+        #.. Update the progression line in the README (added when it does not exist)
+        self._phase(f"✏️ Rewriting progress line to '{progress_value}'...")
+        with self.Tracer.span("rewrite", self.FullName) as record:
+            updated_content, changed = rewrite_progress(content, progress_value)
+            record["bytes"] = len(content)
+
+        if not changed:
+            #.. Same content: no empty commit, no CI run, no write request
+            self.Index.record(self.FullName, progress_value, expected_visibility, readme_file["sha"])
+            self.Outcome = "unchanged"
+            self._report(20, f"💤 '{self.GitData[0]}' already shows '{progress_value}', no commit needed.")
+            return True
+
+        self._phase("📤 Committing README...")
+        with self.Tracer.span("update_file", self.FullName) as record:
+            result = self._call(
+                record, repo.update_file, write=True,
+                path=readme_file["path"],
                 message=f"📝 Progression updated: {progress_value}",
                 content=updated_content,
-                sha=readme_file.sha
+                sha=readme_file["sha"]
             )
+            record["bytes"] = len(updated_content)
+        #.. The cached README is now outdated
+        self.Cache.forget(RepoCache.readme_url(self.FullName))
+        self.Index.record(self.FullName, progress_value, expected_visibility, result["content"].sha)
+        if self.Inventory is not None:
+            self.Inventory.note_readme(self.FullName, readme_file["path"], result["content"].sha)
+        self.Commit = result["commit"].sha
+        self.Outcome = "updated"
 
-            show_box(20, f"✅ Progression updated to '{progress_value}' in '{self.GitData[0]}'")
-            time.sleep(1.5)
+        self._report(20, f"✅ Progression updated to '{progress_value}' in '{self.GitData[0]}'")
+        return True
 
-        except GithubException as e:
-            show_box(e.status if e.status in (403, 404) else 505, e)
-        except Exception as e:
-            show_box(101, e)
+    def _edit_tree(self, progress_value: str, patterns: tuple) -> bool:
+        #.. Git Data API: every marked file goes into one tree, one commit and one ref update,
+        #.. so the write cost is 3 requests whatever the number of files
+        repo = self.Repo
+        expected_visibility = self.GitData[2]
+        branch = self.RepoMeta.get("default_branch") or "main"
+
+        self._phase(f"🌳 Reading tree of '{branch}'...")
+        with self.Tracer.span("get_tree", self.FullName) as record:
+            ref = self._call(record, repo.get_git_ref, f"heads/{branch}")
+            head = self._call(record, repo.get_git_commit, ref.object.sha)
+            tree = self._call(record, repo.get_git_tree, head.tree.sha, recursive=True)
+
+        candidates = [
+            element for element in tree.tree
+            if element.type == "blob" and any(fnmatch.fnmatch(element.path.lower(), p) for p in patterns)
+        ]
+
+        self._phase(f"📥 Fetching {len(candidates)} candidate file(s)...")
+        elements = []
+        written = 0
+        root_readme = None
+        for element in candidates:
+            with self.Tracer.span("get_blob", self.FullName) as record:
+                blob = self._call(record, repo.get_git_blob, element.sha)
+                content = base64.b64decode(blob.content)
+                record["bytes"] = len(content)
+            if "/" not in element.path and element.path.lower() == "readme.md":
+                root_readme = (element, content)
+            if find_progress(content) is None:
+                continue
+
+            updated_content, changed = rewrite_progress(content, progress_value)
+            if changed:
+                elements.append(InputGitTreeElement(element.path, element.mode, "blob",
+                                                    content=updated_content.decode("utf-8")))
+                written += len(updated_content)
+
+        #.. Like GitEdit: no marker anywhere, the root README gets one
+        if not elements and root_readme is not None and find_progress(root_readme[1]) is None:
+            element, content = root_readme
+            updated_content, _ = rewrite_progress(content, progress_value)
+            elements.append(InputGitTreeElement(element.path, element.mode, "blob",
+                                                content=updated_content.decode("utf-8")))
+            written += len(updated_content)
+
+        if root_readme is None and not elements:
+            #.. Nothing matched (README.rst, README elsewhere...): the contents API finds the README
+            return self._edit_readme(progress_value)
+
+        if not elements:
+            self.Index.record(self.FullName, progress_value, expected_visibility, root_readme[0].sha, mode="tree")
+            self.Outcome = "unchanged"
+            self._report(20, f"💤 Every marked file of '{self.GitData[0]}' already shows '{progress_value}'.")
+            return True
+
+        self._phase(f"📤 Committing {len(elements)} file(s) in one commit...")
+        with self.Tracer.span("commit_tree", self.FullName) as record:
+            new_tree = self._call(record, repo.create_git_tree, elements, tree, write=True)
+            commit = self._call(record, repo.create_git_commit,
+                                f"📝 Progression updated: {progress_value}", new_tree, [head], write=True)
+            self._call(record, ref.edit, commit.sha, write=True)
+            record["bytes"] = written
+
+        self.Cache.forget(RepoCache.readme_url(self.FullName))
+        if root_readme is not None:
+            #.. A tree entry also stands for the README: only recorded when the root README was checked
+            readme_sha = next((e.sha for e in new_tree.tree if e.path.lower() == "readme.md"), None)
+            self.Index.record(self.FullName, progress_value, expected_visibility, readme_sha, mode="tree")
+        self.Commit = commit.sha
+        self.Outcome = "updated"
+
+        self._report(20, f"✅ Progression updated to '{progress_value}' in {len(elements)} file(s) "
+                       f"of '{self.GitData[0]}' ({commit.sha[:7]})")
+        return True
@@ -0,0 +1,126 @@
+"""
+Job journal of batch runs, in CONFIG_DIR/journal.sqlite3.
+
+Every repository of a Fleet run goes planned -> in_flight -> done / failed, and the state is
+committed to SQLite at each step with the commit SHA of the write. A run that dies halfway
+(crash, sleep, expired token) is found again by its plan: the same user, mode and entries.
+Its done repositories are then reported from the journal without any request and only the
+rest is updated.
+
+A repository left in_flight may or may not have been written: it is simply run again, Master
+reads the README first and finds it already up to date instead of committing twice.
+
+Only a run that died is resumed (jobs still planned or in_flight). A run that reached its end is
+closed even when some repositories failed: the next run of the manifest starts over.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from cache import CONFIG_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    plan TEXT NOT NULL,
+    created REAL NOT NULL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS runs_plan ON runs (plan, finished);
+CREATE TABLE IF NOT EXISTS jobs (
+    run INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    repo TEXT NOT NULL,
+    status TEXT NOT NULL,
+    visibility TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'planned',
+    outcome TEXT,
+    commit_sha TEXT,
+    message TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated REAL,
+    PRIMARY KEY (run, repo)
+);
+"""
+
+
+def plan_key(user: str, entries: list, mode: str = "readme") -> str:
+    """Identity of a run: interrupted and resumed runs of the same manifest share it."""
+    data = json.dumps([user, mode, sorted(map(list, entries))], ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class JobJournal:
+    """
+    SQLite journal shared by the workers of a run (one connection, one lock).
+    Finished runs older than `keep_days` are dropped when the journal is opened.
+    """
+    def __init__(self, path: str = None, keep_days: int = 30):
+        self.Path = path or os.path.join(CONFIG_DIR, "journal.sqlite3")
+        os.makedirs(os.path.dirname(self.Path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.Path, check_same_thread=False, isolation_level=None)
+        #.. WAL + NORMAL: each state change is one small durable append, not a full fsync of the file
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(SCHEMA)
+        self._db.execute("DELETE FROM runs WHERE finished IS NOT NULL AND finished < ?",
+                         (time.time() - keep_days * 86400,))
+
+    def open_run(self, plan: str, jobs: list) -> tuple:
+        """
+        (run id, {repo: done row}) for `jobs` [(full_name, status, visibility)]: the interrupted
+        run of the same plan when there is one, a new run otherwise.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT id FROM runs WHERE plan = ? AND finished IS NULL ORDER BY id DESC LIMIT 1",
+                                   (plan,)).fetchone()
+            self._db.execute("BEGIN")
+            if row is not None and not self._db.execute(
+                    "SELECT 1 FROM jobs WHERE run = ? AND state IN ('planned', 'in_flight') LIMIT 1", row).fetchone():
+                #.. Every job got an answer, only the close was missed: nothing to resume
+                self._db.execute("UPDATE runs SET finished = ? WHERE id = ?", (time.time(), row[0]))
+                row = None
+            if row is None:
+                run = self._db.execute("INSERT INTO runs (plan, created) VALUES (?, ?)", (plan, time.time())).lastrowid
+            else:
+                run = row[0]
+            self._db.executemany("INSERT OR IGNORE INTO jobs (run, repo, status, visibility, updated) "
+                                 "VALUES (?, ?, ?, ?, ?)", [(run, *job, time.time()) for job in jobs])
+            self._db.execute("COMMIT")
+
+            done = self._db.execute("SELECT repo, outcome, commit_sha, message FROM jobs WHERE run = ? AND state = 'done'",
+                                    (run,)).fetchall()
+        return run, {repo: {"outcome": outcome, "commit": sha, "message": message} for repo, outcome, sha, message in done}
+
+    def start(self, run: int, repo: str):
+        with self._lock:
+            self._db.execute("UPDATE jobs SET state = 'in_flight', attempts = attempts + 1, updated = ? "
+                             "WHERE run = ? AND repo = ?", (time.time(), run, repo))
+
+    def finish(self, run: int, repo: str, ok: bool, outcome: str, commit: str = None, message: str = ""):
+        with self._lock:
+            self._db.execute("UPDATE jobs SET state = ?, outcome = ?, commit_sha = ?, message = ?, updated = ? "
+                             "WHERE run = ? AND repo = ?",
+                             ("done" if ok else "failed", outcome, commit, message, time.time(), run, repo))
+
+    def close_run(self, run: int) -> bool:
+        """Marks `run` finished, so the next run of the plan starts over. True when every job is done."""
+        with self._lock:
+            left = self._db.execute("SELECT COUNT(*) FROM jobs WHERE run = ? AND state != 'done'", (run,)).fetchone()[0]
+            self._db.execute("UPDATE runs SET finished = ? WHERE id = ?", (time.time(), run))
+        return left == 0
+
+    def states(self, run: int) -> dict:
+        """{state: count} of a run."""
+        with self._lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM jobs WHERE run = ? GROUP BY state", (run,)).fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
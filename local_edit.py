@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+
+from git import Repo
+from git.exc import GitCommandError
+
+from rewrite import PROGRESS_MAP, rewrite_progress, find_progress
+
+
+class LocalMaster:
+    """
+    Local-clone backend (GitPython): the same progress rewrite as Master, applied to a working copy.
+        - Every tracked README carrying the progress marker (root and subdirectories) is rewritten.
+        - All of them land in one commit, followed by a single push.
+        - A bare repository (a local mirror for example) is cloned to a temporary folder and pushed
+          back to, so no network access is needed at all.
+        - A working copy with staged or uncommitted changes is refused: they would end up in the
+          progress commit.
+        - In a working copy, `branch` must be the checked out branch.
+    """
+    def __init__(self, path: str, status: str, pathspecs: tuple = (":(icase)*readme.md",),
+                 remote: str = "origin", branch: str = None, push: bool = True):
+        self.Path = path
+        self.Status = status
+        self.Pathspecs = pathspecs
+        self.Remote = remote
+        self.Branch = branch
+        self.Push = push
+
+        self.LastReport = (0, "")
+        self.Outcome = "pending"  # updated / unchanged / failed
+        self.Changed = []  # paths rewritten by the last run
+        self.Commit = None
+
+    def _show(self, code: int, data=None):
+        self.LastReport = (code, "" if data is None else str(data))
+
+    def _rewrite(self, workdir: str, paths: list, progress_value: str) -> list:
+        changed = []
+        marked = []
+        for path in paths:
+            full_path = os.path.join(workdir, path)
+            with open(full_path, "rb") as f:
+                content = f.read()
+            if find_progress(content) is None:
+                continue
+
+            marked.append(path)
+            updated, was_changed = rewrite_progress(content, progress_value)
+            if was_changed:
+                with open(full_path, "wb") as f:
+                    f.write(updated)
+                changed.append(path)
+
+        #.. Like GitEdit: no marker anywhere, the root README gets one
+        if not marked:
+            root = next((p for p in paths if "/" not in p), None)
+            if root is not None:
+                with open(os.path.join(workdir, root), "rb") as f:
+                    updated, _ = rewrite_progress(f.read(), progress_value)
+                with open(os.path.join(workdir, root), "wb") as f:
+                    f.write(updated)
+                changed.append(root)
+        return changed
+
+    def GitEdit(self) -> bool:
+        progress_value = PROGRESS_MAP.get(self.Status, "📛 Unknown")
+        self.Outcome = "failed"
+        clone_dir = None
+
+        try:
+            repo = Repo(self.Path)
+            if repo.bare:
+                clone_dir = tempfile.mkdtemp(prefix="git-progress-")
+                options = {"branch": self.Branch} if self.Branch else {}
+                repo = Repo.clone_from(self.Path, clone_dir, **options)
+            elif repo.is_dirty():
+                self._show(409, f"❌ '{self.Path}' has staged or uncommitted changes, commit or stash them first.")
+                return False
+            elif self.Branch and (repo.head.is_detached or repo.active_branch.name != self.Branch):
+                #.. The commit goes on the checked out branch: never pull or push it as another one
+                current = "a detached HEAD" if repo.head.is_detached else f"'{repo.active_branch.name}'"
+                self._show(409, f"❌ '{self.Path}' has {current} checked out, not '{self.Branch}': check it out first.")
+                return False
+
+            branch = self.Branch or repo.active_branch.name
+            if clone_dir is None and self.Push and repo.remotes:
+                #.. Start from the remote state, the single push must be a fast-forward
+                repo.remote(self.Remote).pull(branch, ff_only=True)
+
+            paths = [p for p in repo.git.ls_files("--", *self.Pathspecs).splitlines() if p]
+            if not paths:
+                self._show(404, f"❌ No README found in '{self.Path}'.")
+                return False
+
+            self.Changed = self._rewrite(repo.working_tree_dir, paths, progress_value)
+            if not self.Changed:
+                self.Outcome = "unchanged"
+                self._show(20, f"💤 {len(paths)} README(s) in '{self.Path}' already show '{progress_value}'.")
+                return True
+
+            repo.index.add(self.Changed)
+            self.Commit = repo.index.commit(f"📝 Progression updated: {progress_value}").hexsha
+
+            if self.Push and repo.remotes:
+                #.. One push for every README of the run
+                repo.remote(self.Remote).push(refspec=f"HEAD:refs/heads/{branch}").raise_if_error()
+
+            self.Outcome = "updated"
+            self._show(20, f"✅ Progression updated to '{progress_value}' in {len(self.Changed)} file(s) "
+                           f"of '{self.Path}' ({self.Commit[:7]})")
+            return True
+
+        except GitCommandError as e:
+            self._show(505, e)
+        except Exception as e:
+            self._show(101, e)
+        finally:
+            if clone_dir is not None:
+                shutil.rmtree(clone_dir, ignore_errors=True)
+        return False
@@ -0,0 +1,144 @@
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+
+class Tracer:
+    """
+    Per-phase timing of the update pipeline (get_repo, get_readme, decode, rewrite, update_file, ...).
+    Each span records its duration, the bytes it moved and the API calls it made (retries included).
+    Thread safe, one Tracer can be shared by every Master of a run, a window or a service.
+    Export: summary text (NeonApp output panel), JSON lines, Prometheus text format.
+    Counts, sums and maxima are kept for the whole life of the Tracer (Prometheus counters never
+    go down), only the last `keep` spans are kept for the records and the quantiles.
+    """
+    def __init__(self, keep: int = 10000):
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=keep)
+        self._totals = {}  # phase -> count, total, max, last, bytes, api_calls, errors
+        self._outcomes = {}
+        self._events = {}
+
+    @contextmanager
+    def span(self, phase: str, repo: str = ""):
+        record = {"ts": round(time.time(), 3), "repo": repo, "phase": phase, "seconds": 0.0,
+                  "bytes": 0, "api_calls": 0, "ok": True}
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record["ok"] = False
+            raise
+        finally:
+            record["seconds"] = round(time.perf_counter() - started, 6)
+            with self._lock:
+                self._records.append(record)
+                totals = self._totals.setdefault(phase, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0,
+                                                         "bytes": 0, "api_calls": 0, "errors": 0})
+                totals["count"] += 1
+                totals["total"] += record["seconds"]
+                totals["max"] = max(totals["max"], record["seconds"])
+                totals["last"] = record["seconds"]
+                totals["bytes"] += record["bytes"]
+                totals["api_calls"] += record["api_calls"]
+                totals["errors"] += 0 if record["ok"] else 1
+
+    def outcome(self, outcome: str):
+        with self._lock:
+            self._outcomes[outcome] = self._outcomes.get(outcome, 0) + 1
+
+    def count(self, event: str, n: int = 1):
+        """Counts a pipeline event (write_conflict, conflict_resolved, ...)."""
+        with self._lock:
+            self._events[event] = self._events.get(event, 0) + n
+
+    def events(self) -> dict:
+        with self._lock:
+            return dict(self._events)
+
+    def records(self) -> list:
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> dict:
+        """phase -> count, total / p50 / p95 / max seconds, bytes, api_calls, errors."""
+        with self._lock:
+            records = list(self._records)
+            totals = {phase: dict(t) for phase, t in self._totals.items()}
+
+        window = {}
+        for record in records:
+            window.setdefault(record["phase"], []).append(record["seconds"])
+
+        summary = {}
+        for phase, t in totals.items():
+            #.. Quantiles over the kept spans, the last duration when the phase left the window
+            durations = sorted(window.get(phase, [t["last"]]))
+            summary[phase] = {
+                "count": t["count"],
+                "total": round(t["total"], 6),
+                "p50": durations[int(0.50 * (len(durations) - 1))],
+                "p95": durations[int(0.95 * (len(durations) - 1))],
+                "max": t["max"],
+                "bytes": t["bytes"],
+                "api_calls": t["api_calls"],
+                "errors": t["errors"],
+            }
+        return summary
+
+    def outcomes(self) -> dict:
+        with self._lock:
+            return dict(self._outcomes)
+
+    def format_summary(self) -> str:
+        lines = ["📊 Phase timings"]
+        for phase, s in sorted(self.summary().items(), key=lambda item: -item[1]["total"]):
+            lines.append(
+                f"  {phase:<14} x{s['count']:<4} total {s['total'] * 1000:8.1f} ms   p95 {s['p95'] * 1000:8.1f} ms   "
+                f"{s['api_calls']} call(s)   {s['bytes'] / 1024:.1f} KB"
+            )
+        events = self.events()
+        if events:
+            lines.append("  " + "   ".join(f"{event} {count}" for event, count in sorted(events.items())))
+        return "\n".join(lines)
+
+    def to_jsonl(self) -> str:
+        return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.records())
+
+    def to_prometheus(self, prefix: str = "git_progress") -> str:
+        summary = self.summary()
+        lines = [
+            f"# HELP {prefix}_phase_seconds Time spent in each phase of the update pipeline.",
+            f"# TYPE {prefix}_phase_seconds summary",
+        ]
+        for phase, s in summary.items():
+            lines.append(f'{prefix}_phase_seconds{{phase="{phase}",quantile="0.5"}} {s["p50"]}')
+            lines.append(f'{prefix}_phase_seconds{{phase="{phase}",quantile="0.95"}} {s["p95"]}')
+            lines.append(f'{prefix}_phase_seconds_sum{{phase="{phase}"}} {s["total"]}')
+            lines.append(f'{prefix}_phase_seconds_count{{phase="{phase}"}} {s["count"]}')
+
+        for name, key, text in (("bytes", "bytes", "Bytes transferred"), ("api_calls", "api_calls", "GitHub API calls"),
+                                ("phase_errors", "errors", "Phases that raised")):
+            lines.append(f"# HELP {prefix}_{name}_total {text} per phase.")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for phase, s in summary.items():
+                lines.append(f'{prefix}_{name}_total{{phase="{phase}"}} {s[key]}')
+
+        lines.append(f"# HELP {prefix}_events_total Pipeline events (write conflicts, ...).")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for event, count in self.events().items():
+            lines.append(f'{prefix}_events_total{{event="{event}"}} {count}')
+
+        lines.append(f"# HELP {prefix}_updates_total Finished updates by outcome.")
+        lines.append(f"# TYPE {prefix}_updates_total counter")
+        for outcome, count in self.outcomes().items():
+            lines.append(f'{prefix}_updates_total{{outcome="{outcome}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str):
+        """Writes the records as JSON lines, or Prometheus text when `path` ends with .prom / .txt."""
+        data = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_jsonl()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
@@ -0,0 +1,48 @@
+"""
+Reporters receive what Master has to say while it updates a repository.
+
+    report(code, message, repo)   outcome or notice, `code` follows boxes.show_box (20 = information)
+    progress(text, repo)          a pipeline phase is starting
+
+A reporter must never block: modal dialogs belong to the caller, once the whole run is over
+(see boxes.show_summary). The Qt log panel reporter lives in boxes.py with the other PyQt6 code.
+"""
+import sys
+import json
+import time
+import threading
+
+
+class NullReporter:
+    """Drops everything, the caller reads Master.LastReport instead."""
+    def report(self, code: int, message: str, repo: str = ""):
+        pass
+
+    def progress(self, text: str, repo: str = ""):
+        pass
+
+
+class StreamReporter(NullReporter):
+    """One line per message on `stream` (stderr by default), or one JSON object per line."""
+    def __init__(self, stream=None, as_json: bool = False, phases: bool = True):
+        self.Stream = stream if stream is not None else sys.stderr
+        self.AsJson = as_json
+        self.Phases = phases
+        self._lock = threading.Lock()  # fleet workers share one reporter
+
+    def _write(self, kind: str, code: int, text: str, repo: str):
+        if self.AsJson:
+            line = json.dumps({"ts": round(time.time(), 3), "repo": repo, "kind": kind, "code": code,
+                               "message": text}, ensure_ascii=False)
+        else:
+            line = f"[{repo}] {text.strip()}"
+        with self._lock:
+            self.Stream.write(line + "\n")
+            self.Stream.flush()
+
+    def report(self, code: int, message: str, repo: str = ""):
+        self._write("report", code, message, repo)
+
+    def progress(self, text: str, repo: str = ""):
+        if self.Phases:
+            self._write("progress", 0, text, repo)
@@ -0,0 +1,49 @@
+import re
+
+# Status keys (NeonApp combo box / manifests) -> text written after "Progress :"
+PROGRESS_MAP = {
+    "under_dev": "🔴 Under Development",
+    "ready_soon": "🟠 Soon Ready",
+    "finished": "🟢 Ended",
+    "under_update": "🔘 Updating",
+}
+
+# Compiled once: the "Progress : <value>" line, with optional markdown decoration around it
+# (quote, list, code...). Works on the raw README bytes, so there is no decode / encode round trip,
+# and `[^\r\n]` keeps "\r\n" line endings untouched.
+PROGRESS_PATTERN = re.compile(
+    rb'^([ >\<\-\*\`]*progress[ \t]*:[ \t]*)([^\r\n]*?)([ >\<\-\*\`]*)(?=\r?$)',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def find_progress(content: bytes):
+    """Returns the match of the first progress line, scanning stops right there."""
+    return PROGRESS_PATTERN.search(content)
+
+
+def read_progress(content: bytes) -> str:
+    """Current progress value of a README, or None when it has no progress line."""
+    match = find_progress(content)
+    return match.group(2).decode("utf-8", "replace").strip() if match else None
+
+
+def rewrite_progress(content: bytes, progress_value: str) -> tuple:
+    """
+    Writes `progress_value` on the first progress line of `content`, in a single pass.
+    Returns (updated_content, changed). A README without progress line gets one appended.
+    """
+    value = progress_value.encode("utf-8")
+    match = find_progress(content)
+
+    if match is None:
+        newline = b"\r\n" if b"\r\n" in content else b"\n"
+        return content + newline * 2 + b"Progress : " + value, True
+
+    if match.group(2).strip() == value:
+        return content, False
+
+    start, end = match.span(2)
+    if not match.group(1).endswith((b" ", b"\t")):
+        value = b" " + value  # "Progress :" written without any value yet
+    return content[:start] + value + content[end:], True
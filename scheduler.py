@@ -0,0 +1,146 @@
+import time
+import random
+import threading
+
+
+class RateScheduler:
+    """
+    Request scheduler shared by the Master instances using the same token.
+        - Token bucket: requests are paced at `max_rate` while the budget is comfortable, and the
+          remaining budget is spread evenly until the reset once it drops under `low_water`.
+        - The bucket is fed from the X-RateLimit-Remaining / Limit / Reset headers.
+        - Content writes are spaced by `write_interval` seconds (GitHub allows ~80 writes per minute).
+        - `Retry-After`, primary / secondary rate limit answers and 5xx errors are retried with
+          jittered exponential backoff, at most `retries` times.
+        - Only rate limit answers (and `Retry-After`) hold every caller of the scheduler, a 5xx or
+          a network error only delays the request that got it.
+    """
+    def __init__(self, max_rate: float = 10.0, burst: int = 10, write_interval: float = 0.75,
+                 low_water: float = 0.1, retries: int = 5, backoff: float = 1.0, max_backoff: float = 60.0):
+        self.MaxRate = max_rate
+        self.Burst = burst
+        self.WriteInterval = write_interval
+        self.LowWater = low_water
+        self.Retries = retries
+        self.Backoff = backoff
+        self.MaxBackoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._rate = max_rate
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._next_write = 0.0
+        self._paused_until = 0.0
+        self._remaining = -1
+        self._limit = -1
+        self._reset = 0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.Burst, self._tokens + (now - self._stamp) * self._rate)
+        self._stamp = now
+
+    def acquire(self, write: bool = False):
+        """Blocks until one request (or one write) may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+
+            wait = max(self._paused_until - now, 0.0)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self._rate)
+            if write:
+                wait = max(wait, self._next_write - now)
+                self._next_write = now + wait + self.WriteInterval
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Holds every caller of this scheduler for `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def observe(self, remaining: int, limit: int, reset: int):
+        """Feeds the bucket with the last known primary rate limit state."""
+        if remaining < 0 or limit <= 0:
+            return
+
+        with self._lock:
+            self._remaining, self._limit, self._reset = remaining, limit, reset
+            until_reset = max(reset - time.time(), 1.0)
+
+            if remaining <= 0:
+                self._paused_until = max(self._paused_until, time.monotonic() + until_reset)
+            elif remaining < limit * self.LowWater:
+                self._rate = min(self.MaxRate, max(remaining / until_reset, 0.01))
+            else:
+                self._rate = self.MaxRate
+
+    def budget(self) -> dict:
+        """Current view of the budget, for batch runs and the UI."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "remaining": self._remaining,
+                "limit": self._limit,
+                "reset": self._reset,
+                "rate": round(self._rate, 3),
+                "tokens": round(self._tokens, 2),
+                "paused_for": round(max(self._paused_until - now, 0.0), 2),
+            }
+
+    def _retry_delay(self, error: Exception, attempt: int):
+        """Seconds to wait before retrying `error`, or None when it must not be retried."""
+        #.. Imported here: the GUI builds its scheduler at startup, PyGithub is loaded with the first update
+        from github.GithubException import GithubException
+
+        jittered = random.uniform(0, min(self.MaxBackoff, self.Backoff * 2 ** attempt))
+
+        if isinstance(error, GithubException):
+            headers = {k.lower(): v for k, v in (error.headers or {}).items()}
+            message = str(error.data).lower() if error.data else ""
+
+            if "retry-after" in headers and (error.status in (403, 429) or error.status >= 500):
+                return float(headers["retry-after"])
+            if error.status in (403, 429):
+                if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+                    return max(float(headers["x-ratelimit-reset"]) - time.time(), 1.0)
+                if "secondary rate limit" in message or "abuse" in message:
+                    return max(60.0, jittered)  # GitHub asks to wait at least one minute
+                return None
+
+            if error.status >= 500:
+                return jittered
+            return None
+
+        if isinstance(error, OSError):  # connection reset, timeout...
+            return jittered
+        return None
+
+    @staticmethod
+    def _holds_everyone(error: Exception) -> bool:
+        """True for answers about the token's budget: the retried delay then applies to every caller."""
+        headers = {k.lower() for k in (getattr(error, "headers", None) or {})}
+        return getattr(error, "status", None) in (403, 429) or "retry-after" in headers
+
+    def call(self, GitHub, func, *args, write: bool = False, **kwargs):
+        """Runs func(*args, **kwargs) under the scheduler, `GitHub` is the client making the request."""
+        attempt = 0
+        while True:
+            self.acquire(write)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt >= self.Retries:
+                    raise
+                if self._holds_everyone(e):
+                    self.pause(delay)
+                else:
+                    time.sleep(delay)  #.. Transient: the other workers keep going
+                attempt += 1
+            finally:
+                requester = GitHub.requester
+                self.observe(requester.rate_limiting[0], requester.rate_limiting[1], requester.rate_limiting_resettime)
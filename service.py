@@ -0,0 +1,258 @@
+"""
+Service mode: a small HTTP API (FastAPI / uvicorn) for deploy pipelines.
+
+    python service.py --port 8080 --workers 4
+
+    POST /status   {"repo": "Git-Progress", "status": "finished", "visibility": "public"}
+    GET  /metrics  queue depth, coalescing, latency and per-phase figures (?format=prometheus)
+    GET  /healthz
+
+Status changes are queued per repository: a burst for one repository becomes a single
+README write of the latest value. Writes run on a bounded pool and reuse Master.
+Set PROGRESS_SERVICE_KEY to require a matching `X-Service-Key` header.
+With --credentials (see credentials.py), writes are spread over several tokens / App installations.
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+from contextlib import asynccontextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+
+from github_edit import Master
+from cache import RepoCache, StatusIndex, RepoInventory
+from scheduler import RateScheduler
+from metrics import Tracer
+from client import CLIENTS, get_client
+from rewrite import PROGRESS_MAP
+
+
+class UpdateQueue:
+    """
+    Coalescing per-repository update queue.
+        - One pending entry per repository: a newer status replaces the queued one.
+        - A repository is written by one worker at a time, changes that arrive meanwhile are
+          applied right after, once, with their latest value.
+        - `debounce` seconds are left between the first request of a burst and its write.
+    """
+    def __init__(self, user: str, token: str, workers: int = 4, debounce: float = 1.0, pool=None):
+        self.GitUser = user
+        self.TOKEN = token
+        self.Debounce = debounce
+
+        self.Cache = RepoCache()
+        self.Scheduler = RateScheduler()
+        self.Index = StatusIndex()
+        self.Tracer = Tracer()
+        self.Pool = pool  # credentials.TokenPool: each write takes the credential with the most budget left
+        get_client(token, pool_size=max(1, workers))  # one keep-alive connection per worker
+        self.Inventory = RepoInventory()
+
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="progress")
+        self._lock = threading.Lock()
+        self._pending = {}  # full_name -> (data_tuple, first enqueue time)
+        self._running = set()
+        self._stats = {"submitted": 0, "coalesced": 0, "written": 0, "unchanged": 0, "failed": 0}
+        self._latencies = []  # seconds from first request to done, last 1000 updates
+        self._last = {}  # full_name -> last result
+        self._pool.submit(self.refresh_inventory)  # known repositories skip get_repo from then on
+
+    def refresh_inventory(self, full: bool = False):
+        if not self.TOKEN:  # installation tokens cannot list /user/repos
+            return
+        try:
+            self.Inventory.refresh(get_client(self.TOKEN), full=full)
+            self.Inventory.save()
+        except Exception:  # the service still works without it, each update checks live
+            pass
+
+    def submit(self, user: str, repo: str, status: str, visibility: str) -> dict:
+        full_name = f"{user}/{repo}"
+        data_tuple = (user, self.TOKEN, repo, status, visibility)
+
+        with self._lock:
+            self._stats["submitted"] += 1
+            coalesced = full_name in self._pending
+            if coalesced:
+                self._stats["coalesced"] += 1
+                self._pending[full_name] = (data_tuple, self._pending[full_name][1])
+            else:
+                self._pending[full_name] = (data_tuple, time.monotonic())
+            start = not coalesced and full_name not in self._running
+            if start:
+                self._running.add(full_name)
+
+        if start:
+            timer = threading.Timer(self.Debounce, self._pool.submit, args=(self._drain, full_name))
+            timer.daemon = True
+            timer.start()
+        return {"repo": full_name, "status": status, "coalesced": coalesced}
+
+    def _drain(self, full_name: str):
+        while True:
+            with self._lock:
+                item = self._pending.pop(full_name, None)
+                if item is None:
+                    self._running.discard(full_name)
+                    return
+            data_tuple, enqueued = item
+            user = data_tuple[0]
+
+            try:
+                lease = self.Pool.lease(user) if self.Pool is not None else nullcontext((self.TOKEN, self.Scheduler))
+                with lease as (token, scheduler):
+                    Call = Master((user, token, *data_tuple[2:]), cache=self.Cache, scheduler=scheduler,
+                                  index=self.Index, tracer=self.Tracer, inventory=self.Inventory)
+                    ok = Call.GitEdit()
+                outcome, message = Call.Outcome, Call.LastReport[1]
+            except Exception as e:  # a worker must keep draining whatever happens
+                ok, outcome, message = False, "failed", str(e)
+
+            latency = time.monotonic() - enqueued
+            with self._lock:
+                self._stats["failed" if not ok else "written" if outcome == "updated" else "unchanged"] += 1
+                self._latencies = self._latencies[-999:] + [latency]
+                self._last[full_name] = {"status": data_tuple[3], "ok": ok, "outcome": outcome,
+                                         "message": message, "latency": round(latency, 3)}
+            self.Cache.save()
+            self.Index.save()
+            self.Inventory.save()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = dict(self._stats)
+            depth, in_flight = len(self._pending), len(self._running)
+
+        def percentile(q: float) -> float:
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3) if latencies else 0.0
+
+        return {
+            "queue_depth": depth,
+            "in_flight": in_flight,
+            **stats,
+            "latency_p50": percentile(0.50),
+            "latency_p95": percentile(0.95),
+            "latency_max": round(latencies[-1], 3) if latencies else 0.0,
+            "budget": self.Pool.budget() if self.Pool is not None else self.Scheduler.budget(),
+            "phases": self.Tracer.summary(),
+            "events": self.Tracer.events(),
+        }
+
+    def prometheus(self) -> str:
+        metrics = self.metrics()
+        lines = []
+        for name in ("queue_depth", "in_flight", "latency_p50", "latency_p95", "latency_max"):
+            lines.append(f"# TYPE git_progress_{name} gauge")
+            lines.append(f"git_progress_{name} {metrics[name]}")
+        for name in ("submitted", "coalesced", "written", "unchanged", "failed"):
+            lines.append(f"# TYPE git_progress_requests_{name}_total counter")
+            lines.append(f"git_progress_requests_{name}_total {metrics[name]}")
+        lines.append("# TYPE git_progress_rate_remaining gauge")
+        lines.append(f"git_progress_rate_remaining {metrics['budget']['remaining']}")
+        return "\n".join(lines) + "\n" + self.Tracer.to_prometheus()
+
+    def last(self, full_name: str) -> dict:
+        with self._lock:
+            return self._last.get(full_name)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        self.Cache.save()
+        self.Index.save()
+        self.Inventory.save()
+
+
+class StatusRequest(BaseModel):
+    repo: str
+    status: str
+    visibility: str = "public"
+    user: str = ""
+
+
+def create_app(queue: UpdateQueue, service_key: str = "") -> FastAPI:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        queue.close()  # let queued writes finish and save cache / index
+
+    app = FastAPI(title="Git Progress service", lifespan=lifespan)
+
+    def check_key(key: str):
+        if service_key and key != service_key:
+            raise HTTPException(status_code=401, detail="Invalid service key")
+
+    @app.post("/status", status_code=202)
+    def post_status(body: StatusRequest, x_service_key: str = Header(default="")):
+        check_key(x_service_key)
+        if body.status not in PROGRESS_MAP:
+            raise HTTPException(status_code=422, detail=f"Unknown status, expected one of {list(PROGRESS_MAP)}")
+
+        if body.visibility not in ("public", "private"):
+            raise HTTPException(status_code=422, detail="Unknown visibility, expected 'public' or 'private'")
+
+        user, repo = (body.repo.split("/", 1) if "/" in body.repo else (body.user or queue.GitUser, body.repo))
+        if not user or not repo:
+            raise HTTPException(status_code=422, detail="Missing owner or repository: send 'owner/repo', "
+                                                        "or 'repo' with a 'user' / a service started with --user")
+        return queue.submit(user, repo, body.status, body.visibility)
+
+    @app.get("/status/{user}/{repo}")
+    def get_status(user: str, repo: str, x_service_key: str = Header(default="")):
+        check_key(x_service_key)
+        result = queue.last(f"{user}/{repo}")
+        if result is None:
+            raise HTTPException(status_code=404, detail="No update for this repository yet")
+        return result
+
+    @app.get("/metrics")
+    def get_metrics(format: str = "json"):
+        if format == "prometheus":
+            return PlainTextResponse(queue.prometheus(), media_type="text/plain; version=0.0.4")
+        return queue.metrics()
+
+    @app.get("/healthz")
+    def healthz():
+        return {"ok": True}
+
+    return app
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="service.py", description="HTTP service for README status updates.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=4, help="concurrent README writes")
+    parser.add_argument("--debounce", type=float, default=1.0, help="seconds to gather a burst before writing")
+    parser.add_argument("--user", default="", help="default owner when requests give a bare repo name")
+    parser.add_argument("--token", default="")
+    parser.add_argument("--credentials", default="",
+                        help="JSON / YAML / TOML file of extra tokens and GitHub App installations")
+    parser.add_argument("--timeout", type=int, default=15, help="seconds before a GitHub request is abandoned")
+    args = parser.parse_args(argv)
+
+    from cli import resolve_credentials
+    import uvicorn
+
+    from credentials import load_pool
+
+    user, token = resolve_credentials(args.user, args.token)
+    pool = load_pool(args.credentials, [token]) if args.credentials else None
+    if not token and pool is None:
+        print("❌ Missing token (use --token, $GITHUB_TOKEN, --credentials or save it once from the app)",
+              file=sys.stderr)
+        return 2
+
+    CLIENTS.configure(timeout=args.timeout)
+    queue = UpdateQueue(user, token, args.workers, args.debounce, pool)
+    uvicorn.run(create_app(queue, os.getenv("PROGRESS_SERVICE_KEY", "")), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
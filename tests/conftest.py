@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "benchmarks")]
+
+#.. cache.CONFIG_DIR is read at import: the tests never touch the real config folder
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="git-progress-tests-")
@@ -0,0 +1,26 @@
+import json
+import threading
+
+import cache
+from cache import StatusIndex
+
+
+def test_an_older_snapshot_never_replaces_a_newer_save(tmp_path, monkeypatch):
+    index = StatusIndex(str(tmp_path / "status.json"))
+    index.record("u/a", "old", "public", None)
+    replace, other = cache.os.replace, []
+
+    def slow_replace(src, dst):
+        #.. Another worker records and saves while the first snapshot is being written
+        if not other:
+            other.append(threading.Thread(target=lambda: (index.record("u/b", "new", "public", None), index.save())))
+            other[0].start()
+            other[0].join(0.5)
+        replace(src, dst)
+
+    monkeypatch.setattr(cache.os, "replace", slow_replace)
+    index.save()
+    other[0].join()
+
+    with open(index.Path, encoding="utf-8") as f:
+        assert set(json.load(f)) == {"u/a", "u/b"}
@@ -0,0 +1,47 @@
+import pytest
+
+from cache import RepoCache, StatusIndex
+from fake_github import FakeGitHub
+from github_edit import Master
+from rewrite import PROGRESS_MAP
+from scheduler import RateScheduler
+
+ENDED = PROGRESS_MAP["finished"]
+
+
+@pytest.fixture
+def fake():
+    fake = FakeGitHub()
+    fake.start()
+    yield fake
+    fake.stop()
+
+
+def master(fake, tmp_path, repo="repo"):
+    Call = Master(("u", "token", repo, "finished", "public"), cache=RepoCache(str(tmp_path / "cache.json")),
+                  scheduler=RateScheduler(max_rate=10_000, burst=10_000, write_interval=0.0),
+                  index=StatusIndex(str(tmp_path / "status.json")), base_url=fake.url)
+    Call.ConflictBackoff = 0.0
+    return Call
+
+
+def test_conflict_rereads_and_keeps_the_other_commit(fake, tmp_path):
+    Call = master(fake, tmp_path)
+    assert Call.Prefetch()  # README read here...
+    fake.repo("u/repo")["content"] += b"\nOther writer\n"  # ...and changed before our write
+
+    assert Call.GitEdit()
+    assert Call.Outcome == "updated"
+    assert Call.Tracer.events() == {"write_conflict": 1, "conflict_resolved": 1}
+    readme = fake.readme("u/repo")
+    assert ENDED in readme and "Other writer" in readme
+
+
+def test_conflict_gives_up_after_the_last_retry(fake, tmp_path):
+    fake.ConflictRate = 1.0
+    Call = master(fake, tmp_path)
+
+    assert not Call.GitEdit()
+    assert Call.LastReport[0] == 409
+    assert fake.stats()["PUT contents"] == Call.ConflictRetries + 1
+    assert Call.Tracer.events()["conflict_gave_up"] == 1
@@ -0,0 +1,107 @@
+import os
+import threading
+
+import pytest
+
+import github_edit
+from cache import RepoCache, StatusIndex
+from fake_github import FakeGitHub
+from fleet import Fleet
+from journal import JobJournal, plan_key
+from rewrite import PROGRESS_MAP
+from scheduler import RateScheduler
+
+ENTRIES = [(f"repo-{i}", "finished", "public") for i in range(12)]
+
+
+def fast_scheduler():
+    return RateScheduler(max_rate=10_000, burst=10_000, write_interval=0.0, backoff=0.01)
+
+
+@pytest.fixture
+def fake():
+    fake = FakeGitHub()
+    fake.start()
+    yield fake
+    fake.stop()
+
+
+def test_open_run_reuses_the_unfinished_run(tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    plan = plan_key("u", ENTRIES)
+    jobs = [(f"u/{repo}", status, visibility) for repo, status, visibility in ENTRIES]
+
+    run, done = journal.open_run(plan, jobs)
+    assert done == {}
+    journal.start(run, "u/repo-0")
+    journal.finish(run, "u/repo-0", True, "updated", "abc1234", "ok")
+    journal.start(run, "u/repo-1")  # left in flight
+
+    again, done = journal.open_run(plan, jobs)
+    assert again == run
+    assert done == {"u/repo-0": {"outcome": "updated", "commit": "abc1234", "message": "ok"}}
+    assert journal.states(run) == {"done": 1, "in_flight": 1, "planned": len(ENTRIES) - 2}
+    assert not journal.close_run(run)
+    assert journal.open_run(plan, jobs) == (run + 1, {})
+
+
+def test_plan_key_depends_on_entries_and_mode():
+    assert plan_key("u", ENTRIES) == plan_key("u", list(reversed(ENTRIES)))
+    assert plan_key("u", ENTRIES) != plan_key("u", ENTRIES, "tree")
+    assert plan_key("u", ENTRIES) != plan_key("u", ENTRIES[1:])
+
+
+def test_interrupted_fleet_resumes_without_repeating_writes(fake, tmp_path, monkeypatch):
+    class Crash(BaseException):
+        pass
+
+    original, lock, calls = github_edit.Master.GitEdit, threading.Lock(), []
+
+    def crashing(self):
+        with lock:
+            calls.append(self.FullName)
+            if len(calls) > 5:
+                raise Crash()
+        return original(self)
+
+    def fleet(journal, name):
+        return Fleet("u", "token", ENTRIES, 2, cache=RepoCache(str(tmp_path / f"{name}-cache.json")),
+                     scheduler=fast_scheduler(), index=StatusIndex(str(tmp_path / f"{name}-status.json")),
+                     base_url=fake.url, journal=journal)
+
+    path = str(tmp_path / "journal.sqlite3")
+    monkeypatch.setattr(github_edit.Master, "GitEdit", crashing)
+    with pytest.raises(Crash):
+        fleet(JobJournal(path), "first").Run()
+    monkeypatch.setattr(github_edit.Master, "GitEdit", original)
+    written = fake.stats().get("PUT contents", 0)
+    assert written == 5
+
+    fake.reset_stats()
+    journal = JobJournal(path)
+    report = fleet(journal, "second").Run()  # fresh index: the crashed process never saved its own
+
+    assert report["totals"]["resumed"] == written
+    assert report["totals"]["updated"] == len(ENTRIES) - written
+    assert fake.stats().get("PUT contents", 0) == len(ENTRIES) - written
+    assert all(r["commit"] for r in report["results"])
+    assert journal.states(1) == {"done": len(ENTRIES)}
+    assert os.path.exists(path)
+
+
+def test_completed_run_with_failures_is_not_resumed(fake, tmp_path):
+    fake.Private = {"u/c"}  # listed as public: fails with a 403 on every run
+    cache, index = RepoCache(str(tmp_path / "cache.json")), StatusIndex(str(tmp_path / "status.json"))
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+
+    def run(status):
+        entries = [(repo, status, "public") for repo in ("a", "b", "c")]
+        return Fleet("u", "token", entries, 2, cache=cache, scheduler=fast_scheduler(), index=index,
+                     base_url=fake.url, journal=journal).Run()["totals"]
+
+    assert run("finished")["failed"] == 1
+    assert run("under_dev")["updated"] == 2
+    totals = run("finished")  # same plan as the first run, which ended normally
+
+    assert (totals["updated"], totals["resumed"], totals["failed"]) == (2, 0, 1)
+    assert PROGRESS_MAP["finished"] in fake.readme("u/a")
@@ -0,0 +1,15 @@
+from metrics import Tracer
+
+
+def test_counters_keep_growing_once_the_window_wraps():
+    tracer = Tracer(keep=3)
+    for i in range(5):
+        with tracer.span("get_readme", "u/repo") as record:
+            record["bytes"], record["api_calls"] = 10, 1
+
+    summary = tracer.summary()["get_readme"]
+    assert len(tracer.records()) == 3
+    assert (summary["count"], summary["bytes"], summary["api_calls"]) == (5, 50, 5)
+    prometheus = tracer.to_prometheus()
+    assert 'git_progress_phase_seconds_count{phase="get_readme"} 5' in prometheus
+    assert 'git_progress_bytes_total{phase="get_readme"} 50' in prometheus
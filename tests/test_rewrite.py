@@ -0,0 +1,53 @@
+from rewrite import PROGRESS_MAP, read_progress, rewrite_progress
+
+ENDED = PROGRESS_MAP["finished"]
+
+
+def test_rewrites_value_in_place():
+    content = "# Title\n\n> Progress : 🔴 Under Development\n\nText\n".encode("utf-8")
+    updated, changed = rewrite_progress(content, ENDED)
+    assert changed
+    assert updated == f"# Title\n\n> Progress : {ENDED}\n\nText\n".encode("utf-8")
+
+
+def test_keeps_crlf_line_endings():
+    content = b"# Title\r\nProgress : old\r\nText\r\n"
+    updated, changed = rewrite_progress(content, ENDED)
+    assert changed
+    assert updated == f"# Title\r\nProgress : {ENDED}\r\nText\r\n".encode("utf-8")
+
+
+def test_empty_value_gets_separated_from_the_colon():
+    updated, changed = rewrite_progress(b"Progress :\nText\n", ENDED)
+    assert changed
+    assert updated == f"Progress : {ENDED}\nText\n".encode("utf-8")
+
+
+def test_no_marker_appends_one():
+    updated, changed = rewrite_progress(b"# Title\r\nText", ENDED)
+    assert changed
+    assert updated == f"# Title\r\nText\r\n\r\nProgress : {ENDED}".encode("utf-8")
+
+
+def test_only_the_first_marker_is_rewritten():
+    content = b"Progress : old\n\n```\nprogress : example\n```\n"
+    updated, changed = rewrite_progress(content, ENDED)
+    assert changed
+    assert updated == f"Progress : {ENDED}\n\n```\nprogress : example\n```\n".encode("utf-8")
+
+
+def test_marker_does_not_span_lines():
+    updated, _ = rewrite_progress(b"Progress :\n\nNext paragraph\n", ENDED)
+    assert updated.endswith(b"\n\nNext paragraph\n")
+
+
+def test_unchanged_value_returns_same_bytes():
+    content = f"- Progress : {ENDED}  \nText\n".encode("utf-8")
+    updated, changed = rewrite_progress(content, ENDED)
+    assert not changed
+    assert updated is content
+
+
+def test_read_progress():
+    assert read_progress(f"> progress: {ENDED}\n".encode("utf-8")) == ENDED
+    assert read_progress(b"# No marker\n") is None
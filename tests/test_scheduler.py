@@ -0,0 +1,75 @@
+import time
+
+import pytest
+from github.GithubException import GithubException
+
+from scheduler import RateScheduler
+
+
+@pytest.fixture
+def scheduler():
+    return RateScheduler(backoff=1.0, max_backoff=8.0)
+
+
+def error(status, message="", headers=None):
+    return GithubException(status, {"message": message}, headers or {})
+
+
+def test_retry_after_header_wins(scheduler):
+    assert scheduler._retry_delay(error(403, headers={"Retry-After": "7"}), 0) == 7.0
+
+
+def test_primary_rate_limit_waits_for_reset(scheduler):
+    reset = int(time.time()) + 120
+    delay = scheduler._retry_delay(error(403, headers={"X-RateLimit-Remaining": "0",
+                                                       "X-RateLimit-Reset": str(reset)}), 0)
+    assert 100 <= delay <= 121
+
+
+def test_secondary_rate_limit_waits_a_minute(scheduler):
+    assert scheduler._retry_delay(error(403, "You have exceeded a secondary rate limit"), 0) >= 60.0
+
+
+def test_plain_forbidden_and_client_errors_are_not_retried(scheduler):
+    assert scheduler._retry_delay(error(403, "Resource not accessible"), 0) is None
+    assert scheduler._retry_delay(error(404, "Not Found"), 0) is None
+    assert scheduler._retry_delay(error(409, "sha does not match"), 0) is None
+
+
+def test_server_and_network_errors_back_off(scheduler):
+    for attempt in range(6):
+        assert 0 <= scheduler._retry_delay(error(502), attempt) <= 8.0
+    assert 0 <= scheduler._retry_delay(ConnectionResetError(), 3) <= 8.0
+
+
+def test_other_exceptions_are_not_retried(scheduler):
+    assert scheduler._retry_delay(ValueError("bug"), 0) is None
+
+
+class Client:
+    requester = type("Requester", (), {"rate_limiting": (-1, -1), "rate_limiting_resettime": 0})()
+
+
+def failing(*errors):
+    errors = list(errors)
+
+    def func():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+    return func
+
+
+def test_transient_errors_only_delay_their_caller(monkeypatch):
+    scheduler = RateScheduler()
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(scheduler, "_retry_delay", lambda error, attempt: 30.0)
+    assert scheduler.call(Client, failing(error(502), ConnectionResetError())) == "ok"
+    assert scheduler.budget()["paused_for"] == 0
+
+
+def test_rate_limit_answers_hold_every_caller(monkeypatch):
+    scheduler = RateScheduler()
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    assert scheduler.call(Client, failing(error(403, headers={"Retry-After": "30"}))) == "ok"
+    assert 25 <= scheduler.budget()["paused_for"] <= 30
@@ -0,0 +1,87 @@
+"""
+Watch mode: keep a manifest (JSON / YAML / TOML, see fleet.load_manifest) under version control
+and publish it automatically.
+
+    python cli.py watch progress.yaml --workers 50 --debounce 1.0
+
+Saves are gathered until the file has been quiet for `debounce` seconds, then the manifest is
+diffed against the status index (last applied state) and only the changed repositories are
+pushed, concurrently, through Fleet / Master. Editing 50 entries makes 50 targeted writes.
+"""
+import os
+import sys
+import threading
+
+from fleet import Fleet, load_manifest, print_report
+from cache import RepoCache, StatusIndex, RepoInventory
+from scheduler import RateScheduler
+from metrics import Tracer
+from rewrite import PROGRESS_MAP
+
+
+class ManifestWatcher:
+    """
+    Applies a manifest once, then again after every batch of saves.
+    Cache, index, rate budget and tracer live as long as the watcher, so an unchanged
+    manifest costs no request at all.
+    """
+    def __init__(self, path: str, user: str = "", token: str = "", workers: int = 50, debounce: float = 1.0,
+                 reporter=None, inventory: RepoInventory = None, on_report=print_report, pool=None):
+        self.Path = os.path.abspath(path)
+        self.GitUser = user
+        self.TOKEN = token
+        self.Workers = max(1, workers)
+        self.Debounce = debounce
+        self.Reporter = reporter
+        self.OnReport = on_report
+
+        self.Cache = RepoCache()
+        self.Scheduler = RateScheduler()
+        self.Index = StatusIndex()
+        self.Inventory = inventory
+        self.Pool = pool  # credentials.TokenPool, replaces `token` and Scheduler when given
+        self.Tracer = Tracer()
+
+    def changed(self) -> tuple:
+        """(user, token, entries whose status / visibility differ from the last applied one)."""
+        user, token, entries = load_manifest(self.Path)
+        user, token = self.GitUser or user, self.TOKEN or token
+
+        changed = []
+        for repo, status, visibility in entries:
+            full_name = repo if "/" in repo else f"{user}/{repo}"
+            if not self.Index.is_current(full_name, PROGRESS_MAP.get(status, "📛 Unknown"), visibility):
+                changed.append((repo, status, visibility))
+        return user, token, changed
+
+    def Apply(self) -> dict:
+        """One pass: diff, then push the changed repositories. None when nothing changed."""
+        user, token, entries = self.changed()
+        if not entries:
+            return None
+
+        #.. One worker per changed repository (up to Workers): reads run side by side,
+        #.. writes are still spaced by the shared RateScheduler
+        report = Fleet(user, token, entries, min(self.Workers, len(entries)), cache=self.Cache,
+                       scheduler=self.Scheduler, index=self.Index, tracer=self.Tracer,
+                       reporter=self.Reporter, inventory=self.Inventory, pool=self.Pool).Run()
+        if self.OnReport is not None:
+            self.OnReport(report)
+        return report
+
+    def _apply_safely(self):
+        try:
+            self.Apply()
+        except Exception as e:  # half-saved / invalid manifest, network down: keep watching
+            print(f"⚠️ {os.path.basename(self.Path)} not applied ({e}), waiting for the next save", file=sys.stderr)
+
+    def Run(self, stop_event: threading.Event = None):
+        """Applies the manifest now, then on every change until `stop_event` is set (or Ctrl+C)."""
+        from watchfiles import watch
+
+        self._apply_safely()
+        quiet = max(50, int(self.Debounce * 1000))
+        #.. The folder is watched, not the file: editors often save by writing a copy and renaming it
+        for _ in watch(os.path.dirname(self.Path), watch_filter=lambda change, path: os.path.abspath(path) == self.Path,
+                       step=quiet, debounce=quiet * 10, stop_event=stop_event, recursive=False):
+            self._apply_safely()
@@ -1,15 +1,26 @@
+import time
+STARTED = time.perf_counter()  #.. Origin of the startup report, taken before PyQt6 is loaded
+
 import os
 import sys
+import threading
 import configparser
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QComboBox,
     QPushButton, QLineEdit, QCheckBox, QTextEdit, QGraphicsDropShadowEffect,
-    QMessageBox, QSizePolicy, QSpacerItem
+    QMessageBox, QSizePolicy, QSpacerItem, QCompleter
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QPropertyAnimation, QObject, QRunnable, QThreadPool, QStringListModel, pyqtSignal
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation
 from PyQt6.QtGui import QColor, QIcon
 
-from github_edit import Master
+#.. github_edit / client (and PyGithub with them, ~300 ms) are imported by the pool workers,
+#.. never on the startup path
+from cache import RepoCache, StatusIndex, RepoInventory
+from scheduler import RateScheduler
+from metrics import Tracer
+from boxes import PanelReporter, show_summary
 
 # Status dictionary for status selection
 status_dict = {
@@ -19,6 +30,191 @@ status_dict = {
     "under_update": "🔘 Updating"
 }
 
+# Startup budget (ms) from the first import to the loaded config, checked by the startup report
+STARTUP_BUDGET_MS = 400
+
+# Opt-in low-overhead rendering (remote desktops, slow VMs): no drop shadows, no fade-in
+LITE_ENV = "GITHUB_PROGRESSION_LITE"
+# Startup timing report on stderr
+REPORT_ENV = "GITHUB_PROGRESSION_STARTUP_REPORT"
+
+
+class StartupClock:
+    """Milestones of the window startup, in ms since the first import of this module."""
+    def __init__(self, started: float = STARTED):
+        self.Started = started
+        self.Marks = []  # (name, ms since start)
+
+    def mark(self, name: str):
+        self.Marks.append((name, (time.perf_counter() - self.Started) * 1000))
+
+    def report(self, budget: float = STARTUP_BUDGET_MS) -> str:
+        lines, previous = [], 0.0
+        for name, at in self.Marks:
+            lines.append(f"  {name:<16} +{at - previous:7.1f} ms  {at:7.1f} ms")
+            previous = at
+        total = self.Marks[-1][1] if self.Marks else 0.0
+        verdict = "✅ within" if total <= budget else "⚠️ over"
+        return f"⏱️ Startup {total:.0f} ms ({verdict} the {budget} ms budget)\n" + "\n".join(lines)
+
+
+def lite_requested(argv: list = None) -> bool:
+    return "--lite" in (sys.argv if argv is None else argv) or os.getenv(LITE_ENV, "") not in ("", "0")
+
+
+def report_requested(argv: list = None) -> bool:
+    return "--startup-report" in (sys.argv if argv is None else argv) or os.getenv(REPORT_ENV, "") not in ("", "0")
+
+class UpdateSignals(QObject):
+    """Signals emitted by an UpdateWorker, delivered on the GUI thread."""
+    finished = pyqtSignal(object, bool, int, str)  # worker, ok, code, message
+
+
+class UpdateWorker(QRunnable):
+    """
+    Runs Master.GitEdit on a QThreadPool thread so the window keeps repainting.
+    Progress goes to the window's PanelReporter and `cancel()` stops the update at the next phase.
+    A click always checks the README (force), the status index is only kept up to date.
+    """
+    def __init__(self, data_tuple: tuple, cache: RepoCache, scheduler: RateScheduler, index: StatusIndex,
+                 tracer: Tracer, reporter: PanelReporter, inventory: RepoInventory, prefetch=None):
+        super().__init__()
+        self.data_tuple = data_tuple
+        self.prefetch = prefetch  # PrefetchWorker of the same inputs, started by Apply
+        self.reporter = reporter
+        self.inventory = inventory
+        self.cache = cache
+        self.scheduler = scheduler
+        self.index = index
+        self.tracer = tracer
+        self.repo = f"{data_tuple[0]}/{data_tuple[2]}"
+        self.signals = UpdateSignals()
+        self.cancel_event = threading.Event()
+        self.setAutoDelete(False)  # NeonApp keeps the worker until `finished` is handled
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        from github_edit import Master
+
+        prepared = self.prefetch.result() if self.prefetch is not None else None
+        Call = Master(self.data_tuple, self.reporter, cache=self.cache, cancel=self.cancel_event,
+                      scheduler=self.scheduler, index=self.index, force=True, tracer=self.tracer,
+                      inventory=self.inventory, prepared=prepared)
+        ok = Call.GitEdit()
+        code, message = Call.LastReport
+        self.signals.finished.emit(self, ok, code, message)
+
+
+class PrefetchWorker(QRunnable):
+    """
+    Speculative Master.Prefetch (repo check, README read) started by Apply or when the repo field
+    loses focus, so Approve only has the update_file call left. Status is not part of the inputs:
+    the rewrite happens at Approve.
+    """
+    def __init__(self, data_tuple: tuple, cache: RepoCache, scheduler: RateScheduler, index: StatusIndex,
+                 tracer: Tracer, inventory: RepoInventory):
+        super().__init__()
+        self.data_tuple = data_tuple
+        self.key = prefetch_key(data_tuple)
+        self.cache = cache
+        self.scheduler = scheduler
+        self.index = index
+        self.tracer = tracer
+        self.inventory = inventory
+        self.prepared = None
+        self.done = threading.Event()
+        self.cancel_event = threading.Event()
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def result(self) -> dict:
+        # Prepared data, waited for on a pool thread (None when the prefetch failed or was cancelled)
+        self.done.wait()
+        return None if self.cancel_event.is_set() else self.prepared
+
+    def run(self):
+        try:
+            from github_edit import Master
+
+            Call = Master(self.data_tuple, cache=self.cache, cancel=self.cancel_event, scheduler=self.scheduler,
+                          index=self.index, force=True, tracer=self.tracer, inventory=self.inventory)
+            if Call.Prefetch():
+                self.prepared = Call.Prepared
+        except Exception:  # speculative: the update does the whole chain itself
+            pass
+        finally:
+            self.done.set()
+
+
+def prefetch_key(data_tuple: tuple) -> tuple:
+    # user, token, repo, visibility
+    return data_tuple[0], data_tuple[1], data_tuple[2], data_tuple[4]
+
+
+class InventorySignals(QObject):
+    finished = pyqtSignal(int, str)  # repositories added or changed, error message
+
+
+class InventoryWorker(QRunnable):
+    """Refreshes the RepoInventory off the GUI thread (one conditional request when nothing changed)."""
+    def __init__(self, inventory: RepoInventory, token: str):
+        super().__init__()
+        self.inventory = inventory
+        self.token = token
+        self.signals = InventorySignals()
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            from client import get_client
+
+            changed, error = self.inventory.refresh(get_client(self.token)), ""
+        except Exception as e:  # offline or bad token: completion keeps the previous list
+            changed, error = 0, str(e)
+        self.signals.finished.emit(changed, error)
+
+
+class StartupSignals(QObject):
+    loaded = pyqtSignal(object)  # {"username", "token", "cache", "index", "inventory", "names"}
+
+
+class StartupWorker(QRunnable):
+    """
+    Reads config.ini and the JSON stores off the GUI thread: cache.json holds the README of every
+    repository updated so far and the inventory may list thousands of repositories.
+    """
+    def __init__(self, config_file: str):
+        super().__init__()
+        self.config_file = config_file
+        self.signals = StartupSignals()
+        self.setAutoDelete(False)
+
+    def run(self):
+        username = token = ""
+        config = configparser.ConfigParser()
+        try:
+            config.read(self.config_file)
+        except configparser.Error:  # unreadable config: start like a first launch
+            pass
+        if "USER" in config:
+            username = config["USER"].get("username", "")
+            token = config["USER"].get("token", "")
+
+        inventory = RepoInventory()
+        self.signals.loaded.emit({
+            "username": username,
+            "token": token,
+            "cache": RepoCache(),
+            "index": StatusIndex(),
+            "inventory": inventory,
+            "names": inventory.names(username),
+        })
+
+
 class NeonApp(QWidget):
     """
     NeonApp is a QWidget-based PyQt application for updating a user's GitHub README.md status.
@@ -30,9 +226,13 @@ class NeonApp(QWidget):
         - "Apply Changes" and "Approve" workflow for confirming and executing status updates.
         - Displays a summary and status messages in a read-only QTextEdit.
         - Integrates with a Master class to perform the actual GitHub update operation.
+        - Updates run on a background thread pool with per-phase progress and a Cancel button.
+        - `lite` (--lite / $GITHUB_PROGRESSION_LITE) drops the drop shadows and the fade-in.
     """
-    def __init__(self):
+    def __init__(self, lite: bool = None, clock: StartupClock = None):
         super().__init__()
+        self.lite = lite_requested() if lite is None else lite
+        self.clock = clock if clock is not None else StartupClock()
         self.setWindowTitle("GitHub Progression")
         self.setMinimumSize(900, 600)
         self.resize(950, 650)
@@ -54,7 +254,6 @@ class NeonApp(QWidget):
                 margin-bottom: 25px;
                 letter-spacing: 2px;
                 color: #00fff7;
-                text-shadow: 0 0 10px #00fff7;
             }
             QLineEdit, QComboBox, QTextEdit {
                 border-radius: 12px;
@@ -116,6 +315,7 @@ class NeonApp(QWidget):
                 border: 2.5px solid #00fff7;
             }
         """)
+        self.clock.mark("stylesheet")
 
         # Main vertical layout
         main_layout = QVBoxLayout()
@@ -198,6 +398,12 @@ class NeonApp(QWidget):
         self.approve_btn.hide()
         btn_layout.addWidget(self.approve_btn)
 
+        # Cancel button (visible while updates are running)
+        self.cancel_btn = QPushButton("✖ Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_updates)
+        self.cancel_btn.hide()
+        btn_layout.addWidget(self.cancel_btn)
+
         # Special style for approve_btn (neon green)
         self.approve_btn.setStyleSheet("""
             QPushButton {
@@ -223,13 +429,14 @@ class NeonApp(QWidget):
             }
         """)
 
-        # Neon shadow effect for buttons
-        shadow_btn = QGraphicsDropShadowEffect()
-        shadow_btn.setBlurRadius(25)
-        shadow_btn.setColor(QColor(0, 255, 153, 180))  # neon green shadow
-        shadow_btn.setOffset(0, 0)
-        self.apply_btn.setGraphicsEffect(shadow_btn)
-        self.approve_btn.setGraphicsEffect(shadow_btn)
+        # Neon shadow effect for buttons (an offscreen render pass per repaint, skipped in lite mode)
+        if not self.lite:
+            shadow_btn = QGraphicsDropShadowEffect()
+            shadow_btn.setBlurRadius(25)
+            shadow_btn.setColor(QColor(0, 255, 153, 180))  # neon green shadow
+            shadow_btn.setOffset(0, 0)
+            self.apply_btn.setGraphicsEffect(shadow_btn)
+            self.approve_btn.setGraphicsEffect(shadow_btn)
 
 
         # Output summary text area
@@ -239,51 +446,87 @@ class NeonApp(QWidget):
         self.output.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         right_col.addWidget(self.output)
 
-        # Neon shadow effect for output text
-        shadow_text = QGraphicsDropShadowEffect()
-        shadow_text.setBlurRadius(30)
-        shadow_text.setColor(QColor(0, 255, 255, 150))  # neon cyan shadow
-        shadow_text.setOffset(0, 0)
-        self.output.setGraphicsEffect(shadow_text)
-
+        # Neon shadow effect for output text: the whole panel is re-rendered on every appended line
+        if not self.lite:
+            shadow_text = QGraphicsDropShadowEffect()
+            shadow_text.setBlurRadius(30)
+            shadow_text.setColor(QColor(0, 255, 255, 150))  # neon cyan shadow
+            shadow_text.setOffset(0, 0)
+            self.output.setGraphicsEffect(shadow_text)
+        self.clock.mark("widgets")
+
+
+        # Background updates: queued on a small pool, sharing one metadata cache and rate budget
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(4)
+        self.cache = None  # RepoCache, StatusIndex and RepoInventory come from the StartupWorker
+        self.scheduler = RateScheduler()
+        self.index = None
+        self.tracer = Tracer()
+        self.reporter = PanelReporter(self.output)  # phases and results land in the output panel
+
+        # Repository inventory: instant completion in repo_input and offline visibility checks
+        self.inventory = None
+        self.inventory_job = None
+        self.repo_model = QStringListModel(self)  # filled by finish_startup
+        self.repo_completer = QCompleter(self.repo_model, self)
+        self.repo_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.repo_completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.repo_input.setCompleter(self.repo_completer)
+
+        # Speculative prefetch between Apply and Approve, dropped as soon as an input it used changes
+        self.prefetch = None
+        self.repo_input.editingFinished.connect(self.start_prefetch)
+        self.username_input.textChanged.connect(self.invalidate_prefetch)
+        self.token_input.textChanged.connect(self.invalidate_prefetch)
+        self.repo_input.textChanged.connect(self.invalidate_prefetch)
+        self.public_check.toggled.connect(self.invalidate_prefetch)
+        self.jobs = []
+        self.results = []
 
         # Config file paths
         self.config_dir = os.path.join(os.getenv("APPDATA") or os.path.expanduser("~"), "GitHubProgression")
         self.config_file = os.path.join(self.config_dir, "config.ini")
 
-        # Load config on startup
-        self.load_config()
+        # Config and stores are read on the pool, Apply waits for them
+        self.apply_btn.setEnabled(False)
+        self.startup_job = StartupWorker(self.config_file)
+        self.startup_job.signals.loaded.connect(self.finish_startup)
+        self.pool.start(self.startup_job)
 
         # Fade-in animation for window
-        self.opacity_anim = QPropertyAnimation(self, b"windowOpacity")
-        self.opacity_anim.setDuration(800)
-        self.opacity_anim.setStartValue(0)
-        self.opacity_anim.setEndValue(1)
-        self.opacity_anim.start()
-
-    def load_config(self):
-        # Load user credentials from config file
-        if not os.path.exists(self.config_file):
+        if not self.lite:
+            self.opacity_anim = QPropertyAnimation(self, b"windowOpacity")
+            self.opacity_anim.setDuration(800)
+            self.opacity_anim.setStartValue(0)
+            self.opacity_anim.setEndValue(1)
+            self.opacity_anim.start()
+        self.clock.mark("window")
+
+    def finish_startup(self, loaded: dict):
+        # StartupWorker is done: stores, saved credentials, completion list, timing report
+        self.startup_job = None
+        self.cache, self.index, self.inventory = loaded["cache"], loaded["index"], loaded["inventory"]
+        self.repo_model.setStringList(loaded["names"])
+        self.load_config(loaded["username"], loaded["token"])
+        self.clock.mark("config")
+        if report_requested():
+            print(self.clock.report(), file=sys.stderr)
+
+    def load_config(self, username: str, token: str):
+        # Fill the inputs with the credentials read from the config file
+        if username and token:
+            self.username_input.setText(username)
+            self.token_input.setText(token)
+            self.username_input.setReadOnly(True)
+            self.token_input.setReadOnly(True)
+            self.token_input.setEchoMode(QLineEdit.EchoMode.Normal)
+            self.apply_btn.setEnabled(True)
+            self.reset_btn.setEnabled(True)
+            self.approve_btn.hide()
+            self.output.hide()
             self.set_inputs_enabled(True)
-            return
-        config = configparser.ConfigParser()
-        config.read(self.config_file)
-        if "USER" in config:
-            username = config["USER"].get("username", "")
-            token = config["USER"].get("token", "")
-            if username and token:
-                self.username_input.setText(username)
-                self.token_input.setText(token)
-                self.username_input.setReadOnly(True)
-                self.token_input.setReadOnly(True)
-                self.token_input.setEchoMode(QLineEdit.EchoMode.Normal)
-                self.apply_btn.setEnabled(True)
-                self.reset_btn.setEnabled(True)
-                self.approve_btn.hide()
-                self.output.hide()
-                self.set_inputs_enabled(True)
-            else:
-                self.set_inputs_enabled(True)
+            self.refresh_inventory()
         else:
             self.set_inputs_enabled(True)
 
@@ -305,7 +548,7 @@ class NeonApp(QWidget):
         self.username_input.setReadOnly(False)
         self.token_input.setReadOnly(False)
         self.token_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.apply_btn.setEnabled(True)
+        self.apply_btn.setEnabled(self.cache is not None)
         self.output.hide()
         self.approve_btn.hide()
         self.set_inputs_enabled(True)
@@ -324,6 +567,7 @@ class NeonApp(QWidget):
             return
 
         self.save_config(self.username, self.token)
+        self.refresh_inventory()
 
         self.username_input.setReadOnly(True)
         self.token_input.setReadOnly(True)
@@ -342,14 +586,35 @@ class NeonApp(QWidget):
         self.approve_btn.setEnabled(True)
 
         self.set_inputs_enabled(True)  # Inputs remain enabled after apply
+        self.start_prefetch()
 
     def approve_changes(self):
-        # Execute the GitHub update operation
-        self.output.setText("🚀 Launching procedure...\n\n" + self.summary_text)
+        # Queue the GitHub update operation on the worker pool
+        if not self.jobs:
+            self.output.clear()
+            self.results = []
+        self.output.append("🚀 Launching procedure...\n\n" + self.summary_text + "\n")
         self.approve_btn.setEnabled(False)
-        self.apply_btn.setEnabled(False)
-        self.set_inputs_enabled(False)
+        self.approve_btn.hide()
+
+        data_tuple = self.current_data()
+
+        # A prefetch of these very inputs saves the repo check and the README read
+        prefetch = self.prefetch if self.prefetch is not None and self.prefetch.key == prefetch_key(data_tuple) else None
+        self.prefetch = None
+
+        worker = UpdateWorker(data_tuple, self.cache, self.scheduler, self.index, self.tracer, self.reporter,
+                              self.inventory, prefetch)
+        worker.signals.finished.connect(self.update_finished)
+        self.jobs.append(worker)
+        self.pool.start(worker)
+
+        # Inputs stay usable so another update can be queued right away
+        self.cancel_btn.show()
+        self.cancel_btn.setEnabled(True)
+        self.set_inputs_enabled(True)
 
+    def current_data(self) -> tuple:
         # Clean and extract input values
         username = self.username_input.text().strip() or "UnknownUser"
         token = self.token_input.text().strip()
@@ -366,13 +631,65 @@ class NeonApp(QWidget):
         status_key = self.status_combo.currentData()
         visibility = "🌐 Public" if self.public_check.isChecked() else "🔒 Private"
 
-        data_tuple = (username, token, repo, status_key, visibility)
+        return (username, token, repo, status_key, visibility)
 
+    def start_prefetch(self):
+        # Check the repo and read its README in the background while the user reviews the summary
+        if self.cache is None or not self.token_input.text().strip() or not self.repo_input.text().strip():
+            return
+        data_tuple = self.current_data()
+        if self.prefetch is not None and self.prefetch.key == prefetch_key(data_tuple):
+            return
+        self.invalidate_prefetch()
+        self.prefetch = PrefetchWorker(data_tuple, self.cache, self.scheduler, self.index, self.tracer,
+                                       self.inventory)
+        self.pool.start(self.prefetch, 1)  # ahead of the updates that may wait for it
+
+    def invalidate_prefetch(self):
+        # An input changed: the prefetched repo / README may no longer be the one to update
+        if self.prefetch is not None:
+            self.prefetch.cancel()
+            self.prefetch = None
+
+    def refresh_inventory(self):
+        # Background refresh of the repository list, one at a time
+        token = self.token_input.text().strip()
+        if not token or self.inventory is None or self.inventory_job is not None:
+            return
+        self.inventory_job = InventoryWorker(self.inventory, token)
+        self.inventory_job.signals.finished.connect(self.inventory_refreshed)
+        self.pool.start(self.inventory_job)
+
+    def inventory_refreshed(self, changed: int, error: str):
+        # New repository names for the completer
+        self.inventory_job = None
+        if not error:
+            self.inventory.save()
+        self.repo_model.setStringList(self.inventory.names(self.username_input.text().strip()))
+
+    def update_finished(self, worker: UpdateWorker, ok: bool, code: int, message: str):
+        # One queued update is over, summarize once the queue is empty
+        if worker in self.jobs:
+            self.jobs.remove(worker)
+        self.results.append((worker.repo, ok, code, message))
+
+        if self.jobs:
+            return
 
-        Call = Master(data_tuple)
-        Call.GitEdit()
-
-        QTimer.singleShot(2000, self.show_done_message)
+        self.cancel_btn.hide()
+        self.output.append(self.tracer.format_summary() + "\n")
+        self.cache.save()
+        self.index.save()
+        self.inventory.save()
+        show_summary(self.results, self)
+        QTimer.singleShot(0, self.show_done_message)
+
+    def cancel_updates(self):
+        # Stop every queued or running update at its next phase
+        for worker in self.jobs:
+            worker.cancel()
+        self.cancel_btn.setEnabled(False)
+        self.output.append("🛑 Cancelling...")
 
     def set_inputs_enabled(self, enabled: bool):
         # Enable or disable input fields and buttons
@@ -382,16 +699,20 @@ class NeonApp(QWidget):
         self.status_combo.setEnabled(enabled)
         self.public_check.setEnabled(enabled)
         if enabled:
-            self.apply_btn.setEnabled(True)
+            self.apply_btn.setEnabled(self.cache is not None)  # not before the StartupWorker is done
 
     def show_done_message(self):
         # Show completion message after update
-        self.output.setText("✅ All done!\nNow You Can Close That Window")
+        self.output.append("✅ All done!\nNow You Can Close That Window")
         self.approve_btn.hide()
 
 
 if __name__ == "__main__":
+    clock = StartupClock()
+    clock.mark("imports")
     app = QApplication(sys.argv)
-    window = NeonApp()
+    clock.mark("QApplication")
+    window = NeonApp(clock=clock)
     window.show()
+    clock.mark("shown")
     sys.exit(app.exec())
\ No newline at end of file